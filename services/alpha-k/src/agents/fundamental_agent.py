@@ -110,15 +110,15 @@ class FundamentalAgent:
             if not competitors:
                 return 0
 
+            # 최대 5개 경쟁사 PER 병렬 조회
+            codes = [comp["ticker_code"] for comp in competitors[:5]]
+            infos = self.data.get_stock_info_batch(codes)
+
             per_values = []
-            for comp in competitors[:5]:  # 최대 5개
-                try:
-                    info = self.data.get_stock_info(comp["ticker_code"])
-                    per = info.get("per", 0)
-                    if per and 0 < per < 200:  # 유효한 PER만
-                        per_values.append(per)
-                except Exception:
-                    continue
+            for info in infos.values():
+                per = info.get("per", 0)
+                if per and 0 < per < 200:  # 유효한 PER만
+                    per_values.append(per)
 
             if per_values:
                 avg_per = sum(per_values) / len(per_values)
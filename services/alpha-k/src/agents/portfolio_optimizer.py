@@ -182,7 +182,7 @@ class PortfolioOptimizer:
             try:
                 rows = self.db.fetch_all(
                     """
-                    SELECT time, close
+                    SELECT time, close::float8
                     FROM ohlcv_daily
                     WHERE ticker_code = %s
                     ORDER BY time DESC
@@ -98,12 +98,11 @@ class SentimentAnalyzer:
                 }
             },
             "sort": [{"published_at": {"order": "desc"}}],
-            "size": limit,
         }
 
         try:
-            results = self.es.client.search(index=ESClient.INDEX_NEWS, body=query)
-            hits = results["hits"]["hits"]
+            # ESClient.search 경유 → ES 장애 시 circuit breaker 가 조회를 건너뛴다
+            hits = self.es.search(ESClient.INDEX_NEWS, query, size=limit)
             return [
                 {
                     "doc_id": hit["_id"],
@@ -5,6 +5,7 @@ import logging
 from typing import List, Optional
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, BackgroundTasks
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -18,9 +19,12 @@ load_dotenv()
 
 from src.supervisor.graph import graph, risk_agent
 from src.supervisor.graph import (
-    market_filter_node, deep_dive_node, scoring_node, trade_setup_node, report_node
+    market_filter_node, deep_dive_async, scoring_node, trade_setup_node, report_node
 )
 from src.infrastructure.db.migrator import run_migrations
+from src.infrastructure.db.db_client import db_client
+from src.infrastructure.db.instrumentation import prometheus_lines
+from src.infrastructure.circuit_breaker import breaker_stats
 
 # Configure logging
 logging.basicConfig(
@@ -70,6 +74,16 @@ class AnalysisResponse(BaseModel):
 async def health():
     return {"status": "ok", "service": "Alpha-K"}
 
+@app.get("/stats")
+async def stats():
+    """DB 풀 / 캐시 적중률 / 조회 지연 / 서킷 브레이커 진단."""
+    return {**db_client.stats(), "breakers": breaker_stats()}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 스크레이프용 텍스트 포맷."""
+    return prometheus_lines({**db_client.stats(), "breakers": breaker_stats()})
+
 @app.post("/analyze", response_model=AnalysisResponse)
 async def analyze(req: AnalysisRequest):
     """
@@ -110,8 +124,8 @@ async def analyze(req: AnalysisRequest):
             result = market_filter_node(state)
             state.update(result)
             
-            # Phase 3: Deep Dive
-            result = deep_dive_node(state)
+            # Phase 3: Deep Dive (종목별 3개 에이전트 병렬)
+            result = await deep_dive_async(state)
             state.update(result)
             
             # Phase 4: Scoring
@@ -130,7 +144,7 @@ async def analyze(req: AnalysisRequest):
         else:
             # ─── Full Pipeline Mode ───
             logger.info("Starting Full Pipeline via LangGraph")
-            final_state = graph.invoke(initial_state)
+            final_state = await graph.ainvoke(initial_state)
 
         report = final_state.get("report", "")
         if not report:
@@ -267,18 +267,17 @@ class BacktestEngine:
         query += " ORDER BY time ASC"
 
         try:
-            rows = self.db.fetch_all(query, tuple(params))
-            if not rows:
+            # COPY → CSV → read_csv: 다년 구간도 행 튜플 없이 바로 float/int 컬럼으로 적재
+            df = self.db.fetch_df(
+                query, tuple(params),
+                dtype={"open": float, "high": float, "low": float, "close": float},
+            )
+            if df.empty:
                 return pd.DataFrame()
 
-            df = pd.DataFrame(rows, columns=["Date", "Open", "High", "Low", "Close", "Volume"])
-            df["Date"] = pd.to_datetime(df["Date"])
-            df = df.set_index("Date")
-
-            # float 변환
-            for col in ["Open", "High", "Low", "Close"]:
-                df[col] = df[col].astype(float)
-            df["Volume"] = df["Volume"].astype(int)
+            df.index = pd.DatetimeIndex(pd.to_datetime(df.pop("time")), name="Date")
+            df.columns = ["Open", "High", "Low", "Close", "Volume"]
+            df["Volume"] = df["Volume"].fillna(0).astype(int)
 
             return df
 
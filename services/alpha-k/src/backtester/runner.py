@@ -70,11 +70,11 @@ class BacktestRunner:
             )
             
             # Invoke Graph
-            # result = graph.invoke(state) # This takes time.
+            # result = asyncio.run(graph.ainvoke(state)) # This takes time. (deep_dive 는 async 노드)
             # For speed, we might want to run specific agents directly, but full graph is better for integrity.
             try:
                 # Mocking graph invoke for now as it's complex and slow
-                # In real imp, we call graph.invoke(state)
+                # In real imp, we call asyncio.run(graph.ainvoke(state))
                 # Here simulating getting trade plans from "RiskAgent"
                 # ...
                 pass 
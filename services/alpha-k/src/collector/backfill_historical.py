@@ -52,6 +52,12 @@ def backfill():
         low = EXCLUDED.low, close = EXCLUDED.close,
         volume = EXCLUDED.volume, change_rate = EXCLUDED.change_rate;
     """
+    # 재적재한 종목의 데이터 버전 증가 → MarketDataProvider OHLCV 캐시 무효화
+    bump_version_sql = """
+    INSERT INTO ticker_versions (ticker_code, version) VALUES (%s, 1)
+    ON CONFLICT (ticker_code) DO UPDATE SET
+        version = ticker_versions.version + 1, updated_at = NOW();
+    """
 
     success = 0
     failed = 0
@@ -65,8 +71,8 @@ def backfill():
                 failed += 1
                 continue
 
-            # DB 저장
-            with db.get_cursor() as cur:
+            # DB 저장 (종목당 수년치 UPSERT → 세션 statement_timeout 미적용)
+            with db.get_cursor(statement_timeout=0) as cur:
                 for date_idx, row in df.iterrows():
                     cur.execute(upsert_sql, (
                         date_idx,
@@ -78,6 +84,7 @@ def backfill():
                         int(row["Volume"]),
                         float(row.get("Change", 0)),
                     ))
+                cur.execute(bump_version_sql, (code,))
                 total_rows += len(df)
 
             success += 1
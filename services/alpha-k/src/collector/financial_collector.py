@@ -72,11 +72,12 @@ class FinancialCollector:
         
         # 3a. Process KIS Data
         if fin_data and isinstance(fin_data, list):
+            records = []
             for item in fin_data:
                 mapped = self._map_kis_response(ticker, item, stock_info)
                 if mapped:
-                    self.repo.save_financial_statement(ticker, mapped)
-                    saved_count += 1
+                    records.append((ticker, mapped))
+            saved_count = self.repo.save_financial_statements_bulk(records)
         
         # 3b. Fallback: Naver Finance Crawler (if KIS failed)
         if saved_count == 0:
@@ -85,9 +86,7 @@ class FinancialCollector:
             crawler = NaverFinanceCrawler()
             naver_data = crawler.get_financials(ticker)
             
-            for item in naver_data:
-                self.repo.save_financial_statement(ticker, item)
-                saved_count += 1
+            saved_count = self.repo.save_financial_statements_bulk([(ticker, item) for item in naver_data])
                 
             if saved_count > 0:
                 logger.info(f"[FinancialCollector] Saved {saved_count} records for {ticker} via Naver.")
@@ -152,16 +152,12 @@ class NewsCrawler:
             return []
 
     def _save_to_es(self, news_list: List[Dict]) -> int:
-        """Elasticsearch에 뉴스 문서를 저장한다."""
-        count = 0
-        for news in news_list:
-            doc_id = news.pop("id")
-            try:
-                self.es.index_document(ESClient.INDEX_NEWS, doc_id, news)
-                count += 1
-            except Exception as e:
-                logger.error(f"[NewsCrawler] ES index failed: {e}")
-        return count
+        """
+        Elasticsearch에 뉴스 문서를 bulk 로 저장한다.
+        (ticker_code, url) 기반 고정 ID 를 op_type=create 로 보내, 이미 색인된 기사는 ES 가 건너뛴다
+        (refresh 전이라 검색에 안 보이는 문서도 중복 적재되지 않음).
+        """
+        return self.es.bulk_index(ESClient.INDEX_NEWS, news_list, op_type="create")
 
 
 # Entry Point for Testing
@@ -0,0 +1,72 @@
+"""
+Circuit Breaker
+===============
+외부 백엔드(Neo4j, Elasticsearch)가 일시적으로 죽었을 때 호출부가 재시도로 몰려드는 것을 막는다.
+연속 실패가 FAIL_THRESHOLD 에 도달하면 COOLDOWN_SEC 동안 호출을 즉시 건너뛰고(open),
+쿨다운이 지나면 다음 호출 한 번만 시험 삼아 통과시키고(half-open), 그 호출이 실패하면 바로 다시 open 한다.
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    FAIL_THRESHOLD = 5
+    COOLDOWN_SEC = 30
+
+    def __init__(self, name: str):
+        self.name = name
+        self.fails = 0
+        self.trips = 0
+        self.open_until = 0.0
+        self.half_open = False
+        self._lock = threading.Lock()
+        _breakers[name] = self
+
+    def allow(self) -> bool:
+        if not self.open_until:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            if now < self.open_until:
+                return False
+            # half-open: 쿨다운 후 첫 호출 하나만 시험 통과. 결과가 안 오면 다음 쿨다운 뒤 다시 시험
+            self.half_open = True
+            self.open_until = now + self.COOLDOWN_SEC
+            return True
+
+    def record_success(self):
+        if self.fails or self.open_until:
+            with self._lock:
+                self.fails = 0
+                self.open_until = 0.0
+                self.half_open = False
+
+    def record_failure(self):
+        with self._lock:
+            self.fails += 1
+            # 시험 호출 실패는 임계치와 무관하게 곧바로 다시 open
+            if self.fails < self.FAIL_THRESHOLD and not self.half_open:
+                return
+            self.fails = 0
+            self.half_open = False
+            self.trips += 1
+            self.open_until = time.monotonic() + self.COOLDOWN_SEC
+        logger.warning(f"[CircuitBreaker] '{self.name}' open for {self.COOLDOWN_SEC}s")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "open": int(time.monotonic() < self.open_until),
+            "fails": self.fails,
+            "trips": self.trips,
+        }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def breaker_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: breaker.stats() for name, breaker in _breakers.items()}
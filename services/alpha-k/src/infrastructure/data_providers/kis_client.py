@@ -9,21 +9,136 @@ Base URL:
   - 모의투자: https://openapivts.koreainvestment.com:29443
 """
 import os
+import copy
 import time
 import logging
+import threading
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
+import numpy as np
+import orjson
 import pandas as pd
+from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# 파싱 결과 dtype. 반환 프레임은 int64/float64 유지: float32는 json.dumps 직렬화가 안 되고,
+# 지수값을 NUMERIC(12,2)로 적재할 때 정밀도 손실이 DB 반올림에 가려진다.
+_DAILY_PRICE_DTYPES = {
+    "Open": np.int64, "High": np.int64, "Low": np.int64, "Close": np.int64,
+    "Volume": np.int64, "Change": np.float64,
+}
+# get_daily_price 컬럼 → KIS output2 필드
+_DAILY_PRICE_FIELDS = {
+    "Open": "stck_oprc",
+    "High": "stck_hgpr",
+    "Low": "stck_lwpr",
+    "Close": "stck_clpr",
+    "Volume": "acml_vol",
+    "Change": "prdy_ctrt",
+}
+_SECTOR_DAILY_DTYPES = {
+    "Open": np.float64, "High": np.float64, "Low": np.float64, "Close": np.float64,
+    "Volume": np.int64,
+}
+
+# KIS 응답 필드 → DataFrame 컬럼 (응답 스펙 고정값, import 시 한 번만 구성)
+_INVESTOR_FIELDS = {
+    "frgn_ntby_qty": "foreigner_net_qty",
+    "orgn_ntby_qty": "institution_net_qty",
+    "prsn_ntby_qty": "individual_net_qty",
+    "frgn_ntby_tr_pbmn": "foreigner_net_amt",
+    "orgn_ntby_tr_pbmn": "institution_net_amt",
+    "prsn_ntby_tr_pbmn": "individual_net_amt",
+}
+_MARKET_INVESTOR_FIELDS = {
+    "frgn_ntby_tr_pbmn": "foreigner_net_amt",
+    "orgn_ntby_tr_pbmn": "institution_net_amt",
+    "prsn_ntby_tr_pbmn": "individual_net_amt",
+}
+_SECTOR_DAILY_FIELDS = {
+    "bstp_nmix_prpr": "Close",
+    "bstp_nmix_oprc": "Open",
+    "bstp_nmix_hgpr": "High",
+    "bstp_nmix_lwpr": "Low",
+    "acml_vol": "Volume",
+}
+_INVESTOR_DTYPES = dict.fromkeys(_INVESTOR_FIELDS.values(), np.int64)
+
+
+def _yyyymmdd(date_str: str) -> str:
+    """'YYYY-MM-DD' / 'YYYYMMDD' → 'YYYYMMDD'."""
+    return date_str.replace("-", "")
+
+
+def _parse_dated_rows(
+    rows: List[Dict[str, Any]], fields: Dict[str, str], dtypes: Dict[str, Any]
+) -> pd.DataFrame:
+    """
+    KIS 일자별 output 리스트 → Date 인덱스 DataFrame.
+    행 단위 try/except 대신 컬럼 단위로 변환: 행에 없는 필드 → 0 (기존 r.get(field, 0)),
+    값은 있으나 변환 불가한 행과 일자가 잘못된 행만 NaN/NaT로 만든 뒤 한 번에 제외한다.
+    """
+    raw = pd.DataFrame.from_records(rows, columns=["stck_bsop_date", *fields])
+    dates = pd.to_datetime(raw["stck_bsop_date"], format="%Y%m%d", errors="coerce")
+
+    data = {}
+    for field, col in fields.items():
+        values = raw[field]
+        data[col] = pd.to_numeric(values, errors="coerce").mask(values.isna(), 0).to_numpy()
+
+    df = pd.DataFrame(data, index=pd.DatetimeIndex(dates, name="Date"))
+    df = df[df.index.notna()].replace([np.inf, -np.inf], np.nan).dropna()
+    if df.empty:
+        return pd.DataFrame()
+    return _ascending(df.astype({col: dtypes[col] for col in fields.values()}))
+
+
+def _stock_info_from(output: Dict[str, Any]) -> Dict[str, Any]:
+    """현재가 시세 output → 종목 기본 정보 (누락 필드 0)."""
+    return {
+        "per": float(output.get("per", 0) or 0),
+        "pbr": float(output.get("pbr", 0) or 0),
+        "eps": float(output.get("eps", 0) or 0),
+        "bps": float(output.get("bps", 0) or 0),
+        "market_cap": int(output.get("hts_avls", 0) or 0),  # 억원 단위
+        "trading_value": int(output.get("acml_tr_pbmn", 0) or 0),  # 거래대금
+        "volume": int(output.get("acml_vol", 0) or 0),
+        "current_price": int(output.get("stck_prpr", 0) or 0),
+        "change_rate": float(output.get("prdy_ctrt", 0) or 0),
+        "w52_high": int(output.get("stck_dryy_hgpr", 0) or 0),
+        "w52_low": int(output.get("stck_dryy_lwpr", 0) or 0),
+    }
+
+
+def _ascending(df: pd.DataFrame) -> pd.DataFrame:
+    """KIS 기간별 응답은 최신일 → 과거 순. 역순이면 슬라이스만, 그 외에만 정렬."""
+    if df.index.is_monotonic_increasing:
+        return df
+    if df.index.is_monotonic_decreasing:
+        return df.iloc[::-1]
+    return df.sort_index()
+
+
+# 프로세스 전체 KIS 커넥션 풀. MarketDataProvider/Collector마다 KISClient가 따로 생성되므로
+# Session(인증 헤더)은 인스턴스별로 두되, 어댑터를 공유해 keep-alive 커넥션을 재사용한다.
+_SHARED_POOL_MAXSIZE = 32
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=2, pool_maxsize=_SHARED_POOL_MAXSIZE)
+
+
 class KISClient:
     """한국투자증권 Open API REST 클라이언트."""
     # ── 실전/모의 Base URL ──
     REAL_URL = "https://openapi.koreainvestment.com:9443"
     DEMO_URL = "https://openapivts.koreainvestment.com:29443"
+    # 인스턴스당 병렬 조회(ThreadPool) 최대 동시 요청 수 (공유 풀 크기 이하)
+    POOL_MAXSIZE = 16
+    # 응답 캐시 TTL (초): 한 의사결정 사이클 내 동일 종목 중복 호출 제거
+    PRICE_CACHE_TTL = 5
+    SECTOR_CACHE_TTL = 3600
 
     def __init__(
         self,
@@ -47,6 +162,27 @@ class KISClient:
 
         self._access_token: Optional[str] = None
         self._token_expired_at: float = 0
+        self._token_lock = threading.Lock()
+
+        # 요청마다 TCP/TLS 핸드셰이크를 반복하지 않도록 Session 재사용 (커넥션 풀은 모듈 공유)
+        self._session = requests.Session()
+        self._session.mount("https://", _HTTP_ADAPTER)
+        # 공통 헤더는 Session에 한 번만 설정 (Authorization은 토큰 발급 시 갱신)
+        self._session.headers.update({
+            "Content-Type": "application/json; charset=utf-8",
+            "appkey": self.app_key,
+            "appsecret": self.app_secret,
+            "custtype": "P",
+            # 반복 필드 키가 많은 JSON이라 압축률이 높다 (br 디코딩은 brotli 패키지 필요)
+            "Accept-Encoding": "gzip, br",
+        })
+
+        # Session을 스레드 간 공유하므로 캐시 접근은 lock으로 보호
+        self._cache_lock = threading.RLock()
+        self._price_cache = TTLCache(maxsize=2048, ttl=self.PRICE_CACHE_TTL)
+        self._info_cache = TTLCache(maxsize=2048, ttl=self.PRICE_CACHE_TTL)
+        self._index_cache = TTLCache(maxsize=256, ttl=self.PRICE_CACHE_TTL)
+        self._sector_cache = TTLCache(maxsize=256, ttl=self.SECTOR_CACHE_TTL)
         
         if not self.is_demo:
              logger.info("[KIS] Initialized in REAL TRADING mode.")
@@ -118,49 +254,63 @@ class KISClient:
     # ═══════════════════════════════════════════════════════════
 
     def _ensure_token(self) -> str:
-        """토큰이 없거나 만료됐으면 재발급."""
+        """
+        토큰이 없거나 만료됐으면 재발급.
+        여러 스레드가 동시에 만료를 보더라도 발급 요청은 한 번만 보낸다 (KIS는 짧은 간격 재발급을 거부).
+        """
         if self._access_token and time.time() < self._token_expired_at:
             return self._access_token
 
+        with self._token_lock:
+            if self._access_token and time.time() < self._token_expired_at:
+                return self._access_token
+            return self._issue_token()
+
+    def _issue_token(self) -> str:
         url = f"{self.base_url}/oauth2/tokenP"
         body = {
             "grant_type": "client_credentials",
             "appkey": self.app_key,
             "appsecret": self.app_secret,
         }
-        resp = requests.post(url, json=body, timeout=10)
+        resp = self._session.post(url, json=body, timeout=10)
         resp.raise_for_status()
         data = resp.json()
 
         self._access_token = data["access_token"]
         # 토큰 유효시간: 약 24h → 23h 후 갱신
         self._token_expired_at = time.time() + 23 * 3600
+        self._session.headers["Authorization"] = f"Bearer {self._access_token}"
         logger.info("[KIS] Access token issued")
         return self._access_token
 
-    def _headers(self, tr_id: str) -> Dict[str, str]:
-        """공통 요청 헤더."""
-        token = self._ensure_token()
-        return {
-            "Content-Type": "application/json; charset=utf-8",
-            "Authorization": f"Bearer {token}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
-            "tr_id": tr_id,
-            "custtype": "P",
-        }
-
     def _get(self, path: str, tr_id: str, params: Dict[str, str]) -> Dict[str, Any]:
-        """GET 요청 공통."""
+        """GET 요청 공통. 호출별로는 tr_id 헤더만 전달하고 나머지는 Session 헤더를 사용."""
         url = f"{self.base_url}{path}"
-        headers = self._headers(tr_id)
-        resp = requests.get(url, headers=headers, params=params, timeout=5)
+        self._ensure_token()
+        resp = self._session.get(url, headers={"tr_id": tr_id}, params=params, timeout=5)
         resp.raise_for_status()
-        data = resp.json()
+        # resp.content는 이미 압축 해제된 bytes → str 디코딩 없이 바로 파싱
+        data = orjson.loads(resp.content)
         if data.get("rt_cd") != "0":
             logger.warning(f"[KIS] API error: {data.get('msg1', 'unknown')}")
         return data
 
+    def _cached(self, cache: TTLCache, key: str, fetch):
+        """
+        TTL 캐시 조회. miss면 fetch() 결과를 저장 (None/빈 응답은 캐시하지 않음).
+        캐시 항목은 호출자 간 공유되지 않도록 얕은 사본으로 반환한다.
+        """
+        with self._cache_lock:
+            value = cache.get(key)
+        if value is None:
+            value = fetch()
+            if not value:
+                return value
+            with self._cache_lock:
+                cache[key] = value
+        return copy.copy(value)
+
     # ═══════════════════════════════════════════════════════════
     # 국내주식 시세
     # ═══════════════════════════════════════════════════════════
@@ -169,7 +319,11 @@ class KISClient:
         """
         주식현재가 시세 [FHKST01010100]
         GET /uapi/domestic-stock/v1/quotations/inquire-price
+        (PRICE_CACHE_TTL 동안 캐시)
         """
+        return self._cached(self._price_cache, ticker, lambda: self._fetch_current_price(ticker))
+
+    def _fetch_current_price(self, ticker: str) -> Dict[str, Any]:
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": ticker,
@@ -182,18 +336,33 @@ class KISClient:
         return data.get("output", {})
 
     def get_daily_price(
-        self, ticker: str, start_date: str, end_date: str, period: str = "D"
+        self,
+        ticker: str,
+        start_date: str,
+        end_date: str,
+        period: str = "D",
+        columns: Optional[Sequence[str]] = None,
     ) -> pd.DataFrame:
         """
         국내주식기간별시세 (일/주/월/년) [FHKST03010100]
         GET /uapi/domestic-stock/v1/quotations/inquire-daily-itemprice
+
+        columns: 필요한 컬럼만 지정 (예: ("Close",)). 지정하지 않으면 전체 OHLCV + Change.
+                 긴 기간 조회에서 쓰지 않는 필드의 변환/메모리를 생략한다.
+        dtype: OHLC/Volume int64, Change float64.
         """
-        all_rows = []
+        if columns is None:
+            columns = tuple(_DAILY_PRICE_FIELDS)
+        else:
+            unknown = set(columns) - _DAILY_PRICE_FIELDS.keys()
+            if unknown:
+                raise ValueError(f"Unknown daily price columns: {sorted(unknown)}")
+
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": ticker,
-            "FID_INPUT_DATE_1": start_date.replace("-", ""),
-            "FID_INPUT_DATE_2": end_date.replace("-", ""),
+            "FID_INPUT_DATE_1": _yyyymmdd(start_date),
+            "FID_INPUT_DATE_2": _yyyymmdd(end_date),
             "FID_PERIOD_DIV_CODE": period,
             "FID_ORG_ADJ_PRC": "0",  # 수정주가
         }
@@ -204,30 +373,8 @@ class KISClient:
             params,
         )
         rows = data.get("output2", [])
-        if not rows:
-            return pd.DataFrame()
-
-        records = []
-        for r in rows:
-            try:
-                records.append({
-                    "Date": pd.to_datetime(r.get("stck_bsop_date", "")),
-                    "Open": int(r.get("stck_oprc", 0)),
-                    "High": int(r.get("stck_hgpr", 0)),
-                    "Low": int(r.get("stck_lwpr", 0)),
-                    "Close": int(r.get("stck_clpr", 0)),
-                    "Volume": int(r.get("acml_vol", 0)),
-                    "Change": float(r.get("prdy_ctrt", 0)),
-                })
-            except (ValueError, TypeError):
-                continue
-
-        if not records:
-            return pd.DataFrame()
-
-        df = pd.DataFrame(records)
-        df = df.set_index("Date").sort_index()
-        return df
+        fields = {_DAILY_PRICE_FIELDS[c]: c for c in columns}
+        return _parse_dated_rows(rows, fields, _DAILY_PRICE_DTYPES)
 
     # ═══════════════════════════════════════════════════════════
     # 투자자별 매매동향 (종목별)
@@ -250,30 +397,7 @@ class KISClient:
             params,
         )
         rows = data.get("output", [])
-        if not rows:
-            return pd.DataFrame()
-
-        records = []
-        for r in rows:
-            try:
-                records.append({
-                    "Date": pd.to_datetime(r.get("stck_bsop_date", "")),
-                    "foreigner_net_qty": int(r.get("frgn_ntby_qty", 0)),
-                    "institution_net_qty": int(r.get("orgn_ntby_qty", 0)),
-                    "individual_net_qty": int(r.get("prsn_ntby_qty", 0)),
-                    "foreigner_net_amt": int(r.get("frgn_ntby_tr_pbmn", 0)),
-                    "institution_net_amt": int(r.get("orgn_ntby_tr_pbmn", 0)),
-                    "individual_net_amt": int(r.get("prsn_ntby_tr_pbmn", 0)),
-                })
-            except (ValueError, TypeError):
-                continue
-
-        if not records:
-            return pd.DataFrame()
-
-        df = pd.DataFrame(records)
-        df = df.set_index("Date").sort_index()
-        return df
+        return _parse_dated_rows(rows, _INVESTOR_FIELDS, _INVESTOR_DTYPES)
 
     # ═══════════════════════════════════════════════════════════
     # 업종 시세
@@ -283,7 +407,13 @@ class KISClient:
         """
         국내주식 업종현재지수 [FHPUP02100000]
         GET /uapi/domestic-stock/v1/quotations/inquire-index-price
+        (PRICE_CACHE_TTL 동안 캐시, get_index_price와 응답 공유)
         """
+        return self._cached(
+            self._index_cache, sector_code, lambda: self._fetch_sector_index(sector_code)
+        )
+
+    def _fetch_sector_index(self, sector_code: str) -> Dict[str, Any]:
         params = {
             "FID_COND_MRKT_DIV_CODE": "U",
             "FID_INPUT_ISCD": sector_code,
@@ -301,12 +431,14 @@ class KISClient:
         """
         국내주식 업종기간별시세 [FHKUP03500100]
         GET /uapi/domestic-stock/v1/quotations/inquire-daily-indexchartprice
+
+        dtype: OHLC float64, Volume int64.
         """
         params = {
             "FID_COND_MRKT_DIV_CODE": "U",
             "FID_INPUT_ISCD": sector_code,
-            "FID_INPUT_DATE_1": start_date.replace("-", ""),
-            "FID_INPUT_DATE_2": end_date.replace("-", ""),
+            "FID_INPUT_DATE_1": _yyyymmdd(start_date),
+            "FID_INPUT_DATE_2": _yyyymmdd(end_date),
             "FID_PERIOD_DIV_CODE": period,
         }
         data = self._get(
@@ -315,29 +447,7 @@ class KISClient:
             params,
         )
         rows = data.get("output2", [])
-        if not rows:
-            return pd.DataFrame()
-
-        records = []
-        for r in rows:
-            try:
-                records.append({
-                    "Date": pd.to_datetime(r.get("stck_bsop_date", "")),
-                    "Close": float(r.get("bstp_nmix_prpr", 0)),
-                    "Open": float(r.get("bstp_nmix_oprc", 0)),
-                    "High": float(r.get("bstp_nmix_hgpr", 0)),
-                    "Low": float(r.get("bstp_nmix_lwpr", 0)),
-                    "Volume": int(r.get("acml_vol", 0)),
-                })
-            except (ValueError, TypeError):
-                continue
-
-        if not records:
-            return pd.DataFrame()
-
-        df = pd.DataFrame(records)
-        df = df.set_index("Date").sort_index()
-        return df
+        return _parse_dated_rows(rows, _SECTOR_DAILY_FIELDS, _SECTOR_DAILY_DTYPES)
 
     # ═══════════════════════════════════════════════════════════
     # 시장별 투자자 매매동향 (시장 전체)
@@ -361,8 +471,8 @@ class KISClient:
         params = {
             "FID_COND_MRKT_DIV_CODE": "J",
             "FID_INPUT_ISCD": market_code,
-            "FID_INPUT_DATE_1": start_date.replace("-", ""),
-            "FID_INPUT_DATE_2": end_date.replace("-", ""),
+            "FID_INPUT_DATE_1": _yyyymmdd(start_date),
+            "FID_INPUT_DATE_2": _yyyymmdd(end_date),
         }
         data = self._get(
             "/uapi/domestic-stock/v1/quotations/inquire-investor-daily",
@@ -370,27 +480,7 @@ class KISClient:
             params,
         )
         rows = data.get("output", [])
-        if not rows:
-            return pd.DataFrame()
-
-        records = []
-        for r in rows:
-            try:
-                records.append({
-                    "Date": pd.to_datetime(r.get("stck_bsop_date", "")),
-                    "foreigner_net_amt": int(r.get("frgn_ntby_tr_pbmn", 0)),
-                    "institution_net_amt": int(r.get("orgn_ntby_tr_pbmn", 0)),
-                    "individual_net_amt": int(r.get("prsn_ntby_tr_pbmn", 0)),
-                })
-            except (ValueError, TypeError):
-                continue
-
-        if not records:
-            return pd.DataFrame()
-
-        df = pd.DataFrame(records)
-        df = df.set_index("Date").sort_index()
-        return df
+        return _parse_dated_rows(rows, _MARKET_INVESTOR_FIELDS, _INVESTOR_DTYPES)
 
     # ═══════════════════════════════════════════════════════════
     # 종목 기본 정보 (PER, PBR, 시총 등)
@@ -400,21 +490,14 @@ class KISClient:
         """
         주식현재가 시세 + 추가 지표 [FHKST01010100]
         PER, PBR, EPS, BPS, 시가총액(HTS_AVLS) 등.
+        (PRICE_CACHE_TTL 동안 캐시, 조회 실패/빈 응답이면 캐시 없이 0으로 채워 반환)
         """
+        info = self._cached(self._info_cache, ticker, lambda: self._build_stock_info(ticker))
+        return info if info is not None else _stock_info_from({})
+
+    def _build_stock_info(self, ticker: str) -> Optional[Dict[str, Any]]:
         output = self.get_current_price(ticker)
-        return {
-            "per": float(output.get("per", 0) or 0),
-            "pbr": float(output.get("pbr", 0) or 0),
-            "eps": float(output.get("eps", 0) or 0),
-            "bps": float(output.get("bps", 0) or 0),
-            "market_cap": int(output.get("hts_avls", 0) or 0),  # 억원 단위
-            "trading_value": int(output.get("acml_tr_pbmn", 0) or 0),  # 거래대금
-            "volume": int(output.get("acml_vol", 0) or 0),
-            "current_price": int(output.get("stck_prpr", 0) or 0),
-            "change_rate": float(output.get("prdy_ctrt", 0) or 0),
-            "w52_high": int(output.get("stck_dryy_hgpr", 0) or 0),
-            "w52_low": int(output.get("stck_dryy_lwpr", 0) or 0),
-        }
+        return _stock_info_from(output) if output else None
 
     # ═══════════════════════════════════════════════════════════
     # 프로그램 매매동향 (종목별)
@@ -456,7 +539,13 @@ class KISClient:
         """
         업종별 종목 리스트 조회 [FHKST03010500]
         GET /uapi/domestic-stock/v1/quotations/inquire-index-category-item-list
+        (SECTOR_CACHE_TTL 동안 캐시)
         """
+        return self._cached(
+            self._sector_cache, sector_code, lambda: self._fetch_sector_tickers(sector_code)
+        )
+
+    def _fetch_sector_tickers(self, sector_code: str) -> List[str]:
         params = {
             "FID_COND_MRKT_DIV_CODE": "U",
             "FID_INPUT_ISCD": sector_code,
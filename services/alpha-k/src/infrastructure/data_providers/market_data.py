@@ -11,23 +11,122 @@ TimescaleDB-first 아키텍처.
 import pandas as pd
 import numpy as np
 import FinanceDataReader as fdr
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import List, Optional, Tuple, Dict
 import logging
 
+from psycopg2.extensions import adapt
+
 from .kis_client import KISClient
 from ..db.db_client import db_client
+from ..db.instrumentation import InstrumentedCache, timed
 
 logger = logging.getLogger(__name__)
 
+# NUMERIC 컬럼은 psycopg2가 Decimal 객체로 돌려주므로 DB에서 float8로 캐스팅해
+# pandas가 바로 float64 컬럼을 만들게 한다 (행별 Decimal 생성 + pd.to_numeric 제거).
+_OHLCV_SELECT = (
+    "open::float8, high::float8, low::float8, close::float8, volume, trading_value"
+)
+
+# ─── OHLCV 윈도우 캐시 (프로세스 공용) ───
+# 여러 에이전트/전략이 같은 (ticker, start, end) 구간을 연달아 조회하므로
+# DB 결과를 LRU로 보관한다. MarketDataProvider 인스턴스 간에 공유.
+OHLCV_CACHE_SIZE = 512
+
+
+_OHLCV_CACHE = InstrumentedCache(OHLCV_CACHE_SIZE)  # 접근은 _OHLCV_CACHE_LOCK 하에서만
+_OHLCV_CACHE_LOCK = threading.RLock()
+db_client.register_cache("ohlcv", _OHLCV_CACHE)
+_OHLCV_LISTEN_CHANNEL = "ohlcv_changed"  # migrations/008_ohlcv_notify_statement.sql
+_ohlcv_listener_started = False
+# 종목별 변경 세대. NOTIFY마다 +1 되어 캐시 키에 포함되므로, 이전 세대 구간은
+# LRU를 훑어 지우지 않아도 도달 불가가 되어 자연히 밀려난다.
+_ohlcv_generations: Dict[str, int] = {}
+
+# 종목별 데이터 버전 (migrations/007_ticker_versions.sql). 캐시 키에 포함해
+# 백필 등 대량 재적재 시 이전 구간 캐시를 스캔 없이 도달 불가로 만든다.
+VERSION_REFRESH_SEC = 10
+_ticker_versions: Dict[str, int] = {}
+_versions_loaded_at = 0.0
+_versions_lock = threading.Lock()
+
+
+# 캐시에 보관할 때만 float32로 압축하는 가격 컬럼. 원화 주가는 정수이고 2^24(약 1,677만) 미만이면
+# float32로 정확히 표현되므로, 반환 시 float64로 되돌려도 값이 같다 (메모리는 절반).
+_COMPACT_PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close')
+_FLOAT32_EXACT_LIMIT = 2 ** 24
+
+
+def _compact_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """캐시 저장용 사본. 무손실일 때만 가격 컬럼을 float32로 내린다."""
+    cols = [c for c in _COMPACT_PRICE_COLUMNS if c in df.columns]
+    values = df[cols].to_numpy(dtype=np.float64)
+    finite = values[np.isfinite(values)]
+    if finite.size and (
+        np.abs(finite).max() >= _FLOAT32_EXACT_LIMIT or not np.array_equal(finite, np.trunc(finite))
+    ):
+        return df.copy()
+    return df.astype(dict.fromkeys(cols, np.float32))
+
+
+def _expand_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """캐시 항목 → 호출자용 사본 (float32 가격 컬럼을 float64로 복원)."""
+    cols = [c for c in _COMPACT_PRICE_COLUMNS if c in df.columns and df[c].dtype == np.float32]
+    return df.astype(dict.fromkeys(cols, np.float64)) if cols else df.copy()
+
+
+def _cache_date(value) -> str:
+    """캐시 키용 날짜 정규화 ('YYYY-MM-DD')."""
+    return pd.Timestamp(value).date().isoformat()
+
+
+def _invalidate_ohlcv(payload: str):
+    """NOTIFY payload "ticker_code" (004 형식 "ticker_code,YYYY-MM-DD" 포함) → 해당 종목 세대 증가."""
+    ticker = payload.partition(',')[0]
+    with _OHLCV_CACHE_LOCK:
+        _ohlcv_generations[ticker] = _ohlcv_generations.get(ticker, 0) + 1
+    logger.debug(f"[MarketData] OHLCV cache generation bumped for {ticker}")
+
+# FDR StockListing 등락 컬럼 (우선순위 순)
+_ADR_CHANGE_COLUMNS = ('ChagesRatio', 'Changes')
+
+
+def _adr_counts(arr: np.ndarray) -> Tuple[int, int]:
+    """등락 배열 → (상승 수, 하락 수). NaN/0 은 보합으로 취급."""
+    signs = np.sign(arr)
+    return int(np.count_nonzero(signs > 0)), int(np.count_nonzero(signs < 0))
+
 
 class MarketDataProvider:
     """주가, 지수, 환율, 수급 데이터를 통합 제공한다. (TimescaleDB-first)"""
+    # DB miss 종목 외부 API fallback 동시 요청 수 (네트워크 대기 위주 → 스레드)
+    FALLBACK_WORKERS = 8
+    # 이 수 이하의 종목 batch 조회는 리터럴 IN 목록으로 SQL 생성
+    LITERAL_IN_MAX = 8
 
     def __init__(self, kis_client: KISClient = None):
         self.kis = kis_client or KISClient()
         self.db = db_client
 
+    def _start_cache_listener(self):
+        """
+        ohlcv_daily 변경 알림 구독 (프로세스당 1회).
+        OHLCV 캐시를 처음 쓸 때, 커넥션 풀이 살아 있는 경우에만 시작한다
+        (DB 없이 도는 실행에서 리스너가 재접속 경고를 반복하지 않도록).
+        """
+        global _ohlcv_listener_started
+        if _ohlcv_listener_started or not self.db.is_available:
+            return
+        with _OHLCV_CACHE_LOCK:
+            if _ohlcv_listener_started:
+                return
+            _ohlcv_listener_started = True
+        self.db.listen(_OHLCV_LISTEN_CHANNEL, _invalidate_ohlcv)
+
     # ═════════════════════════════════════════════
     # OHLCV (TimescaleDB → FDR fallback)
     # ═════════════════════════════════════════════
@@ -46,35 +145,75 @@ class MarketDataProvider:
         return self._get_ohlcv_from_fdr(ticker, start, end)
 
     def _get_ohlcv_from_db(self, ticker: str, start: str, end: str) -> Optional[pd.DataFrame]:
-        """TimescaleDB ohlcv_daily 테이블에서 조회."""
+        """TimescaleDB ohlcv_daily 테이블에서 조회 (LRU 캐시 경유, 호출자에겐 사본 반환)."""
+        self._start_cache_listener()
+        version = self._ticker_version(ticker)
+        with _OHLCV_CACHE_LOCK:
+            key = (ticker, _cache_date(start), _cache_date(end), version,
+                   _ohlcv_generations.get(ticker, 0))
+            cached = _OHLCV_CACHE.get(key)
+            if cached is not None:
+                _OHLCV_CACHE.hits += 1
+                return _expand_ohlcv(cached)
+            _OHLCV_CACHE.misses += 1
+
+        df = self._query_ohlcv(ticker, start, end)
+        if df is not None:
+            compact = _compact_ohlcv(df)
+            with _OHLCV_CACHE_LOCK:
+                _OHLCV_CACHE[key] = compact
+        return df
+
+    def _ticker_version(self, ticker: str) -> int:
+        """
+        종목 데이터 버전 (VERSION_REFRESH_SEC 주기로 전체 맵 갱신).
+        갱신은 주기가 지난 뒤 처음 들어온 스레드 하나만 lock 밖에서 조회하고 결과를 통째로 교체한다.
+        다른 스레드는 기다리지 않고 직전 맵을 쓴다 (즉시 무효화는 NOTIFY 세대 증가가 담당).
+        """
+        global _ticker_versions, _versions_loaded_at
+        with _versions_lock:
+            refresh = time.monotonic() - _versions_loaded_at >= VERSION_REFRESH_SEC
+            if refresh:
+                _versions_loaded_at = time.monotonic()
+        if refresh:
+            try:
+                rows = self.db.fetch_all("SELECT ticker_code, version FROM ticker_versions")
+                _ticker_versions = {code: int(version) for code, version in rows}
+            except Exception as e:
+                logger.debug(f"[MarketData] ticker_versions refresh failed: {e}")
+        return _ticker_versions.get(ticker, 0)
+
+    @timed("ohlcv_db")
+    def _query_ohlcv(self, ticker: str, start: str, end: str) -> Optional[pd.DataFrame]:
         try:
-            query = """
-                SELECT time, open, high, low, close, volume, trading_value, change_rate
+            query = f"""
+                SELECT time, {_OHLCV_SELECT}, change_rate::float8
                 FROM ohlcv_daily
-                WHERE ticker_code = %s AND time >= %s AND time <= %s
+                WHERE ticker_code = $1 AND time >= $2::timestamptz AND time <= $3::timestamptz
                 ORDER BY time ASC
             """
-            rows = self.db.fetch_all(query, (ticker, start, end))
+            rows = self.db.fetch_prepared("ohlcv_fetch", query, (ticker, start, end))
             if not rows:
                 return None
 
-            df = pd.DataFrame(rows, columns=[
+            df = pd.DataFrame.from_records(rows, coerce_float=True, columns=[
                 'time', 'Open', 'High', 'Low', 'Close', 'Volume',
                 'trading_value', 'change_rate'
             ])
             df['time'] = pd.to_datetime(df['time'])
             df.set_index('time', inplace=True)
-
-            # 숫자형 변환
-            for col in ['Open', 'High', 'Low', 'Close', 'Volume']:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-
             return df
 
         except Exception as e:
             logger.debug(f"[MarketData] DB OHLCV query failed for {ticker}: {e}")
             return None
 
+    @staticmethod
+    def cache_stats() -> Dict[str, int]:
+        """OHLCV 캐시 적중률 진단용 카운터 (전체 진단은 db_client.stats())."""
+        with _OHLCV_CACHE_LOCK:
+            return _OHLCV_CACHE.stats()
+
     @staticmethod
     def _get_ohlcv_from_fdr(ticker: str, start: str, end: str) -> pd.DataFrame:
         """FDR에서 OHLCV 조회 (fallback)."""
@@ -104,6 +243,7 @@ class MarketDataProvider:
         logger.debug(f"[MarketData] DB miss for investor data {ticker}, falling back to KIS")
         return self._get_investor_from_kis(ticker)
 
+    @timed("investor_db")
     def _get_investor_from_db(self, ticker: str, days: int = 30) -> Optional[pd.DataFrame]:
         """TimescaleDB investor_trading 테이블에서 조회."""
         try:
@@ -111,24 +251,20 @@ class MarketDataProvider:
                 SELECT time, foreigner_net_qty, institution_net_qty, individual_net_qty,
                        foreigner_net_amt, institution_net_amt, individual_net_amt
                 FROM investor_trading
-                WHERE ticker_code = %s AND time >= NOW() - INTERVAL '%s days'
+                WHERE ticker_code = $1 AND time >= NOW() - $2::int * INTERVAL '1 day'
                 ORDER BY time ASC
             """
-            rows = self.db.fetch_all(query, (ticker, days))
+            rows = self.db.fetch_prepared("investor_fetch", query, (ticker, days))
             if not rows:
                 return None
 
-            df = pd.DataFrame(rows, columns=[
+            df = pd.DataFrame.from_records(rows, coerce_float=True, columns=[
                 'Date', 'foreigner_net_qty', 'institution_net_qty', 'individual_net_qty',
                 'foreigner_net_amt', 'institution_net_amt', 'individual_net_amt'
             ])
             df['Date'] = pd.to_datetime(df['Date'])
             df.set_index('Date', inplace=True)
-
-            for col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-
-            return df
+            return df.fillna(0)
 
         except Exception as e:
             logger.debug(f"[MarketData] DB investor query failed for {ticker}: {e}")
@@ -162,23 +298,23 @@ class MarketDataProvider:
         # Fallback: KIS API → FDR
         return self._get_sector_from_api(sector_code, start, end)
 
+    @timed("sector_db")
     def _get_sector_from_db(self, sector_code: str, start: str, end: str) -> Optional[pd.DataFrame]:
         """TimescaleDB sector_indices에서 조회."""
         try:
             query = """
-                SELECT time, close, change_rate
+                SELECT time, close::float8, change_rate::float8
                 FROM sector_indices
-                WHERE sector_code = %s AND time >= %s AND time <= %s
+                WHERE sector_code = $1 AND time >= $2::timestamptz AND time <= $3::timestamptz
                 ORDER BY time ASC
             """
-            rows = self.db.fetch_all(query, (sector_code, start, end))
+            rows = self.db.fetch_prepared("sector_fetch", query, (sector_code, start, end))
             if not rows:
                 return None
 
-            df = pd.DataFrame(rows, columns=['time', 'Close', 'change_rate'])
+            df = pd.DataFrame.from_records(rows, coerce_float=True, columns=['time', 'Close', 'change_rate'])
             df['time'] = pd.to_datetime(df['time'])
             df.set_index('time', inplace=True)
-            df['Close'] = pd.to_numeric(df['Close'], errors='coerce')
             return df
 
         except Exception as e:
@@ -241,26 +377,55 @@ class MarketDataProvider:
     # Market Breadth (ADR)
     # ═════════════════════════════════════════════
 
+    def get_advancing_declining(self, market: str = "KOSPI") -> Tuple[int, int]:
+        """
+        상승/하락 종목 수 반환. ADR 계산용.
+        TimescaleDB 최신 거래일 집계 우선 → FDR StockListing fallback.
+        """
+        counts = self._get_advancing_declining_from_db(market)
+        if counts is not None:
+            return counts
+        return self._get_advancing_declining_from_fdr(market)
+
+    def _get_advancing_declining_from_db(self, market: str) -> Optional[Tuple[int, int]]:
+        """ohlcv_daily 최신 거래일의 change_rate 부호 집계 (스칼라 2개만 반환)."""
+        try:
+            query = """
+                SELECT COUNT(*) FILTER (WHERE o.change_rate > 0),
+                       COUNT(*) FILTER (WHERE o.change_rate < 0)
+                FROM ohlcv_daily o
+                JOIN tickers t ON t.ticker_code = o.ticker_code
+                WHERE o.time = (SELECT MAX(time) FROM ohlcv_daily)
+                  AND t.market_type = %s
+            """
+            row = self.db.fetch_one(query, (market,))
+            if not row or not (row[0] or row[1]):
+                return None
+            return int(row[0]), int(row[1])
+        except Exception as e:
+            logger.debug(f"[MarketData] DB ADR query failed: {e}")
+            return None
+
     @staticmethod
-    def get_advancing_declining(market: str = "KOSPI") -> Tuple[int, int]:
-        """상승/하락 종목 수 반환. ADR 계산용. FDR StockListing."""
+    def _get_advancing_declining_from_fdr(market: str) -> Tuple[int, int]:
+        """FDR StockListing 기반 상승/하락 종목 수 (fallback)."""
         try:
             df = fdr.StockListing(market)
             if df.empty:
                 return 0, 0
 
-            if 'ChagesRatio' in df.columns:
-                changes = df['ChagesRatio']
-            elif 'Changes' in df.columns:
-                changes = df['Changes']
-            elif 'Close' in df.columns and 'Open' in df.columns:
+            cols = df.columns
+            col = next((c for c in _ADR_CHANGE_COLUMNS if c in cols), None)
+            if col is not None:
+                changes = df[col]
+            elif 'Close' in cols and 'Open' in cols:
                 changes = df['Close'] - df['Open']
             else:
                 return 0, 0
 
-            advancing = int((changes > 0).sum())
-            declining = int((changes < 0).sum())
-            return advancing, declining
+            # FDR 버전에 따라 object(문자열) 컬럼일 수 있어 한 번에 숫자로 강제 변환
+            arr = pd.to_numeric(changes, errors='coerce').to_numpy(dtype=np.float32, copy=False)
+            return _adr_counts(arr)
         except Exception as e:
             logger.warning(f"[MarketData] ADR StockListing failed: {e}")
             return 0, 0
@@ -272,36 +437,72 @@ class MarketDataProvider:
     def get_ohlcv_batch(self, tickers: List[str], start: str, end: str) -> dict:
         """
         여러 종목의 OHLCV를 한 번에 조회 (TimescaleDB).
+        DB에 없는 종목은 FDR에서 스레드 풀로 병렬 조회.
         Returns: {ticker_code: DataFrame}
         """
+        if not tickers:
+            return {}
+        result = self._get_ohlcv_batch_from_db(tickers, start, end)
+
+        missing = [t for t in dict.fromkeys(tickers) if t not in result]
+        if missing:
+            logger.debug(f"[MarketData] Batch DB miss for {len(missing)} tickers, falling back to FDR")
+            workers = min(len(missing), self.FALLBACK_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._get_ohlcv_from_fdr, t, start, end): t
+                    for t in missing
+                }
+                for future in as_completed(futures):
+                    df = future.result()
+                    if not df.empty:
+                        result[futures[future]] = df
+
+        return result
+
+    @timed("ohlcv_batch_db")
+    def _get_ohlcv_batch_from_db(self, tickers: List[str], start: str, end: str) -> dict:
         try:
-            placeholders = ','.join(['%s'] * len(tickers))
+            if len(tickers) <= self.LITERAL_IN_MAX:
+                # 소수 종목: 리터럴 IN 목록 → 플래너가 종목별 인덱스 탐색(BitmapOr)으로 전개
+                # (adapt()가 값을 quoting 하므로 인젝션 안전)
+                in_list = ", ".join(adapt(str(t)).getquoted().decode() for t in tickers)
+                ticker_filter = f"ticker_code IN ({in_list})"
+                params = (start, end)
+            else:
+                # 다수 종목: 리스트를 Postgres 배열 하나로 바인딩 → 쿼리 텍스트 고정
+                ticker_filter = "ticker_code = ANY(%s)"
+                params = (list(tickers), start, end)
             query = f"""
-                SELECT time, ticker_code, open, high, low, close, volume, trading_value
+                SELECT time, ticker_code, {_OHLCV_SELECT}
                 FROM ohlcv_daily
-                WHERE ticker_code IN ({placeholders})
+                WHERE {ticker_filter}
                   AND time >= %s AND time <= %s
                 ORDER BY ticker_code, time ASC
             """
-            params = tuple(tickers) + (start, end)
+            columns = [
+                'time', 'ticker_code', 'Open', 'High', 'Low', 'Close', 'Volume', 'trading_value'
+            ]
             rows = self.db.fetch_all(query, params)
-
             if not rows:
                 return {}
 
-            df_all = pd.DataFrame(rows, columns=[
-                'time', 'ticker_code', 'Open', 'High', 'Low', 'Close', 'Volume', 'trading_value'
-            ])
-            df_all['time'] = pd.to_datetime(df_all['time'])
-            for col in ['Open', 'High', 'Low', 'Close', 'Volume']:
-                df_all[col] = pd.to_numeric(df_all[col], errors='coerce')
-
-            result = {}
-            for ticker, group in df_all.groupby('ticker_code'):
-                g = group.set_index('time').drop(columns=['ticker_code'])
-                result[ticker] = g
-
-            return result
+            df_all = pd.DataFrame.from_records(rows, coerce_float=True, columns=columns)
+            del rows
+            # 인덱스 설정을 그룹마다가 아니라 전체에 한 번만 수행
+            df_all.index = pd.DatetimeIndex(pd.to_datetime(df_all.pop('time')), name='time')
+
+            # SQL이 ticker_code, time 순으로 정렬 → 종목별 행이 연속이므로
+            # 해시 groupby 대신 코드가 바뀌는 경계에서 잘라낸다.
+            # 호출자가 종목 프레임을 수정해도 df_all 이나 다른 종목에 번지지 않도록 복사본을 돌려준다
+            codes = df_all.pop('ticker_code').to_numpy()
+            bounds = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+            starts = np.r_[0, bounds]
+            ends = np.r_[bounds, len(codes)]
+            return {
+                codes[lo]: df_all.iloc[lo:hi].copy()
+                for lo, hi in zip(starts, ends)
+            }
 
         except Exception as e:
             logger.error(f"[MarketData] Batch OHLCV query failed: {e}")
@@ -352,6 +553,19 @@ class MarketDataProvider:
             logger.error(f"[MarketData] Stock info failed for {ticker}: {e}")
             return {}
 
+    def get_stock_info_batch(self, tickers: List[str]) -> Dict[str, dict]:
+        """
+        여러 종목의 기본 정보를 병렬 조회. KIS API.
+        HTTP 대기 시간을 스레드로 겹쳐 처리 (KISClient Session 커넥션 풀 공유).
+        Returns: {ticker_code: stock_info} (입력 순서 유지)
+        """
+        if not tickers or not self.kis.is_configured:
+            return {}
+        workers = min(len(tickers), self.kis.POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            infos = list(executor.map(self.get_stock_info, tickers))
+        return dict(zip(tickers, infos))
+
     def get_financial_statements(self, ticker: str) -> dict:
         """재무제표 요약. KIS API."""
         if not self.kis.is_configured:
@@ -0,0 +1,119 @@
+"""
+DB / Cache Instrumentation
+==========================
+캐시 적중률과 DB 조회 지연을 프로세스 내 카운터로 집계한다.
+db_client.stats() 로 모아 보고, prometheus_lines() 로 텍스트 노출 포맷을 만든다.
+"""
+import bisect
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict
+
+from cachetools import LRUCache
+
+
+class InstrumentedCache(LRUCache):
+    """
+    hit/miss/eviction 카운터를 가진 LRUCache.
+    cachetools 캐시는 thread-safe 하지 않으므로 조회/저장과 카운터 갱신은
+    호출자가 잡은 lock 안에서 함께 이뤄진다 (카운터용 별도 lock/할당 없음).
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize=maxsize)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def popitem(self):
+        self.evictions += 1
+        return super().popitem()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self),
+            "maxsize": int(self.maxsize),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class LatencyHistogram:
+    """고정 버킷(ms) 누적 히스토그램. observe()는 정수 연산만 수행."""
+
+    BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+    def __init__(self):
+        self._bounds_ns = [b * 1_000_000 for b in self.BUCKETS_MS]
+        self._counts = [0] * (len(self.BUCKETS_MS) + 1)  # 마지막 = +Inf
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_ns = 0
+
+    def observe(self, elapsed_ns: int):
+        idx = bisect.bisect_left(self._bounds_ns, elapsed_ns)
+        with self._lock:
+            self._counts[idx] += 1
+            self.count += 1
+            self.total_ns += elapsed_ns
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = list(self._counts)
+            count, total_ns = self.count, self.total_ns
+        cumulative, buckets = 0, {}
+        for bound, n in zip(self.BUCKETS_MS, counts):
+            cumulative += n
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = count
+        return {
+            "count": count,
+            "avg_ms": round(total_ns / count / 1e6, 3) if count else 0.0,
+            "buckets_ms": buckets,
+        }
+
+
+_histograms: Dict[str, LatencyHistogram] = {}
+
+
+def timed(name: str) -> Callable:
+    """함수 실행 시간을 name 히스토그램에 기록하는 데코레이터."""
+    histogram = _histograms.setdefault(name, LatencyHistogram())
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter_ns() - started)
+        return wrapper
+
+    return decorator
+
+
+def latency_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: hist.stats() for name, hist in _histograms.items()}
+
+
+def prometheus_lines(stats: Dict[str, Any], prefix: str = "alpha_k") -> str:
+    """db_client.stats() 결과 → Prometheus text exposition 포맷."""
+    lines = []
+    for key, value in stats.get("pool", {}).items():
+        lines.append(f"{prefix}_db_pool_{key} {value}")
+    for cache, values in stats.get("caches", {}).items():
+        for key, value in values.items():
+            lines.append(f'{prefix}_cache_{key}{{cache="{cache}"}} {value}')
+    for name, values in stats.get("latency", {}).items():
+        for bound, n in values["buckets_ms"].items():
+            lines.append(f'{prefix}_query_duration_ms_bucket{{query="{name}",le="{bound}"}} {n}')
+        lines.append(f'{prefix}_query_duration_ms_count{{query="{name}"}} {values["count"]}')
+    for name, values in stats.get("breakers", {}).items():
+        for key, value in values.items():
+            lines.append(f'{prefix}_breaker_{key}{{backend="{name}"}} {value}')
+    return "\n".join(lines) + "\n"
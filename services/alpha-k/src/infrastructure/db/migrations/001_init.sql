@@ -46,7 +46,7 @@ ALTER TABLE ohlcv_daily SET (
     timescaledb.compress,
     timescaledb.compress_segmentby = 'ticker_code'
 );
-SELECT add_compression_policy('ohlcv_daily', INTERVAL '30 days');
+SELECT add_compression_policy('ohlcv_daily', INTERVAL '30 days', if_not_exists => TRUE);
 
 -- 3. 분봉 데이터 (Hypertable)
 CREATE TABLE IF NOT EXISTS ohlcv_minute (
@@ -68,7 +68,7 @@ ALTER TABLE ohlcv_minute SET (
     timescaledb.compress_segmentby = 'ticker_code'
 );
 -- 분봉은 데이터가 많으므로 7일 지나면 압축
-SELECT add_compression_policy('ohlcv_minute', INTERVAL '7 days');
+SELECT add_compression_policy('ohlcv_minute', INTERVAL '7 days', if_not_exists => TRUE);
 
 
 -- 4. 섹터 지수 (Sector Index)
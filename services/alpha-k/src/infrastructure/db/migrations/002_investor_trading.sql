@@ -26,4 +26,4 @@ ALTER TABLE investor_trading SET (
     timescaledb.compress,
     timescaledb.compress_segmentby = 'ticker_code'
 );
-SELECT add_compression_policy('investor_trading', INTERVAL '30 days');
+SELECT add_compression_policy('investor_trading', INTERVAL '30 days', if_not_exists => TRUE);
@@ -0,0 +1,20 @@
+-- 004_ohlcv_notify.sql
+-- ohlcv_daily 변경 시 'ohlcv_changed' 채널로 "ticker_code,YYYY-MM-DD" 알림
+-- → 애플리케이션 OHLCV 캐시가 TTL 없이 해당 봉을 포함한 구간만 무효화
+--
+-- ※ 008_ohlcv_notify_statement.sql 이 이 행 단위 트리거를 문장 단위(종목당 1건) 트리거로 대체한다.
+--   이미 적용된 DB 와 순서를 맞추기 위해 파일은 그대로 두며, 새 설치에서도 004 → 008 순으로 실행되어
+--   최종 상태는 항상 008 의 트리거다. 알림 형식을 바꿀 때는 이 파일이 아니라 새 마이그레이션을 추가할 것.
+
+CREATE OR REPLACE FUNCTION notify_ohlcv_changed() RETURNS trigger AS $$
+BEGIN
+    -- 같은 트랜잭션 내 동일 payload는 Postgres가 1건으로 합쳐 전달
+    PERFORM pg_notify('ohlcv_changed', NEW.ticker_code || ',' || (NEW.time::date)::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_ohlcv_changed ON ohlcv_daily;
+CREATE TRIGGER trg_ohlcv_changed
+    AFTER INSERT OR UPDATE ON ohlcv_daily
+    FOR EACH ROW EXECUTE FUNCTION notify_ohlcv_changed();
@@ -0,0 +1,27 @@
+-- 005_ohlcv_compression.sql
+-- ohlcv_daily 컬럼형 압축 튜닝
+--   * segmentby ticker_code + orderby time DESC → 종목별 최근 구간 스캔이 압축 배치 단위로 읽힘
+--   * 일봉은 행 수가 적으므로 청크를 30일로 키워 청크 수/플래닝 비용 축소 (신규 청크부터 적용)
+--   * 7일 지난 청크부터 압축 (기존 30일 정책 교체)
+
+DO $$
+BEGIN
+    -- 압축 설정은 이미 압축된 청크가 있으면 변경 불가 → orderby 미설정일 때만 적용
+    IF NOT EXISTS (
+        SELECT 1 FROM timescaledb_information.compression_settings
+        WHERE hypertable_name = 'ohlcv_daily'
+          AND attname = 'time'
+          AND orderby_column_index IS NOT NULL
+    ) THEN
+        ALTER TABLE ohlcv_daily SET (
+            timescaledb.compress,
+            timescaledb.compress_segmentby = 'ticker_code',
+            timescaledb.compress_orderby = 'time DESC'
+        );
+    END IF;
+END $$;
+
+SELECT set_chunk_time_interval('ohlcv_daily', INTERVAL '30 days');
+
+SELECT remove_compression_policy('ohlcv_daily', if_exists => TRUE);
+SELECT add_compression_policy('ohlcv_daily', INTERVAL '7 days', if_not_exists => TRUE);
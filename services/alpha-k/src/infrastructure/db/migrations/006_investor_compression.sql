@@ -0,0 +1,25 @@
+-- 006_investor_compression.sql
+-- investor_trading 압축 튜닝
+--   * segmentby ticker_code + orderby time DESC: 종목별 시계열이 압축 배치 안에서 시간순으로
+--     정렬되어 time은 delta-of-delta, 순매수 수량/금액은 정수 delta 인코딩이 잘 먹힌다
+--   * 수집기가 매일 종목당 최근 30거래일(달력 ~45일)을 UPSERT 하므로 그 창을 벗어난
+--     청크만 압축 → 압축 청크 재해제(decompress) 없이 쓰기 유지
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM timescaledb_information.compression_settings
+        WHERE hypertable_name = 'investor_trading'
+          AND attname = 'time'
+          AND orderby_column_index IS NOT NULL
+    ) THEN
+        ALTER TABLE investor_trading SET (
+            timescaledb.compress,
+            timescaledb.compress_segmentby = 'ticker_code',
+            timescaledb.compress_orderby = 'time DESC'
+        );
+    END IF;
+END $$;
+
+SELECT remove_compression_policy('investor_trading', if_exists => TRUE);
+SELECT add_compression_policy('investor_trading', INTERVAL '45 days', if_not_exists => TRUE);
@@ -0,0 +1,9 @@
+-- 007_ticker_versions.sql
+-- 종목별 데이터 버전. 대량 재적재(백필, 수정주가 반영) 시 +1
+-- → 애플리케이션 OHLCV 캐시 키에 포함되어 이전 구간 캐시가 즉시 무효화된다
+
+CREATE TABLE IF NOT EXISTS ticker_versions (
+    ticker_code VARCHAR(10) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ DEFAULT NOW()
+);
@@ -0,0 +1,49 @@
+-- 008_ohlcv_notify_statement.sql
+-- 004의 행 단위 NOTIFY 트리거를 문장 단위로 교체
+--   * 봉마다 알림을 보내면 backfill_historical(수천 종목 × 수년치) 적재 시 NOTIFY 큐가 넘친다
+--   * 문장마다 전이 테이블(REFERENCING NEW TABLE)에서 종목 코드를 모아 종목당 1건만 전송
+--     payload: "ticker_code"
+--   * 전이 테이블은 이벤트가 하나인 트리거에만 허용 → INSERT / UPDATE 트리거를 나눈다
+--     (INSERT ... ON CONFLICT DO UPDATE 는 두 트리거가 각자 처리한 행으로 발화)
+
+CREATE OR REPLACE FUNCTION notify_ohlcv_tickers_changed() RETURNS trigger AS $$
+DECLARE
+    code TEXT;
+BEGIN
+    FOR code IN SELECT DISTINCT ticker_code FROM changed_rows LOOP
+        PERFORM pg_notify('ohlcv_changed', code);
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 전이 테이블을 지원하지 않는 환경용 행 단위 대체 함수.
+-- 같은 트랜잭션 안의 동일 payload는 Postgres가 1건으로 합쳐 전달하므로 역시 종목당 1건
+CREATE OR REPLACE FUNCTION notify_ohlcv_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('ohlcv_changed', NEW.ticker_code);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_ohlcv_changed ON ohlcv_daily;
+DROP TRIGGER IF EXISTS trg_ohlcv_inserted ON ohlcv_daily;
+DROP TRIGGER IF EXISTS trg_ohlcv_updated ON ohlcv_daily;
+
+DO $$
+BEGIN
+    CREATE TRIGGER trg_ohlcv_inserted
+        AFTER INSERT ON ohlcv_daily
+        REFERENCING NEW TABLE AS changed_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_ohlcv_tickers_changed();
+    CREATE TRIGGER trg_ohlcv_updated
+        AFTER UPDATE ON ohlcv_daily
+        REFERENCING NEW TABLE AS changed_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_ohlcv_tickers_changed();
+EXCEPTION WHEN OTHERS THEN
+    -- 하이퍼테이블 전이 테이블 미지원(TimescaleDB 구버전) → 행 단위 트리거로 대체
+    RAISE NOTICE 'ohlcv_daily transition table trigger unavailable (%), using row trigger', SQLERRM;
+    CREATE TRIGGER trg_ohlcv_changed
+        AFTER INSERT OR UPDATE ON ohlcv_daily
+        FOR EACH ROW EXECUTE FUNCTION notify_ohlcv_changed();
+END $$;
@@ -11,28 +11,81 @@ from src.infrastructure.db.db_client import db_client
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 여러 워커가 동시에 기동해도 마이그레이션은 한 프로세스만 수행 (트랜잭션 종료 시 자동 해제)
+MIGRATION_LOCK_ID = 987654
+
+# 마이그레이터 도입 이전부터 매 기동마다 실행되던 파일 → 대표 테이블.
+# 기존 DB는 schema_migrations가 비어 있어도 이 파일들이 이미 적용된 상태이므로,
+# 대표 테이블이 있으면 적용 완료로 기록한다 (001 재실행 시 압축 청크가 있으면
+# ALTER TABLE ... SET (timescaledb.compress ...)가 실패하고 005의 orderby와도 충돌).
+BASELINE_MIGRATIONS = {
+    "001_init.sql": "ohlcv_daily",
+    "002_investor_trading.sql": "investor_trading",
+    "003_financials.sql": "financial_statements",
+}
+
+
+def _record_baseline(cur, applied: set):
+    """대표 테이블이 이미 존재하는 baseline 파일을 schema_migrations에 기록."""
+    for filename, table in BASELINE_MIGRATIONS.items():
+        if filename in applied:
+            continue
+        cur.execute("SELECT to_regclass(%s) IS NOT NULL", (table,))
+        if cur.fetchone()[0]:
+            cur.execute(
+                "INSERT INTO schema_migrations (filename) VALUES (%s) ON CONFLICT DO NOTHING",
+                (filename,),
+            )
+            applied.add(filename)
+            logger.info(f"[DB] Baseline migration {filename} already present, recorded")
+
+
 def run_migrations():
-    """Run all SQL files in the migrations directory."""
+    """
+    Run all SQL files in the migrations directory.
+    하나의 트랜잭션 안에서 advisory lock을 잡고, schema_migrations에 기록된 파일은 건너뛴다.
+    파일별 SAVEPOINT로 실패한 파일만 되돌리고 나머지는 계속 적용 (다음 기동 시 재시도).
+    """
     migration_dir = os.path.join(os.path.dirname(__file__), "migrations")
     if not os.path.exists(migration_dir):
         logger.warning(f"Metadata migration directory not found: {migration_dir}")
         return
 
     files = sorted([f for f in os.listdir(migration_dir) if f.endswith(".sql")])
-    
-    for filename in files:
-        filepath = os.path.join(migration_dir, filename)
-        logger.info(f"[DB] Applying migration: {filename}")
-        
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                sql = f.read()
-            
-            db_client.execute(sql)
-            logger.info(f"[DB] Migration {filename} applied successfully")
-            
-        except Exception as e:
-            logger.error(f"[DB] Failed to apply migration {filename}: {e}")
+
+    with db_client.get_cursor() as cur:
+        cur.execute("SET LOCAL statement_timeout = 0")
+        cur.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                filename TEXT PRIMARY KEY,
+                applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+            )
+        """)
+        cur.execute("SELECT filename FROM schema_migrations")
+        applied = {row[0] for row in cur.fetchall()}
+        _record_baseline(cur, applied)
+
+        for filename in files:
+            if filename in applied:
+                continue
+
+            filepath = os.path.join(migration_dir, filename)
+            logger.info(f"[DB] Applying migration: {filename}")
+
+            cur.execute("SAVEPOINT migration")
+            try:
+                with open(filepath, "r", encoding="utf-8") as f:
+                    sql = f.read()
+
+                cur.execute(sql)
+                cur.execute("INSERT INTO schema_migrations (filename) VALUES (%s)", (filename,))
+                cur.execute("RELEASE SAVEPOINT migration")
+                logger.info(f"[DB] Migration {filename} applied successfully")
+
+            except Exception as e:
+                cur.execute("ROLLBACK TO SAVEPOINT migration")
+                logger.error(f"[DB] Failed to apply migration {filename}: {e}")
 
 if __name__ == "__main__":
     run_migrations()
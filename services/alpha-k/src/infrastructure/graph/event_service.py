@@ -8,6 +8,44 @@ from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 from .neo4j_client import graph_client
 
+# 관계 타입은 파라미터화할 수 없으므로 허용 목록별로 쿼리를 미리 만들어 둔다.
+# 세 엔티티를 OPTIONAL MATCH 로 한 번에 찾아 존재하는 것에만 MERGE (왕복 1회).
+# Event 는 elementId 로 한 번만 찾아 WITH 로 넘긴다.
+_LINK_QUERY_TEMPLATE = """
+MATCH (e:Event) WHERE elementId(e) = $eid
+WITH e
+OPTIONAL MATCH (t:Ticker {{ticker: $id}})
+OPTIONAL MATCH (s:Sector {{sector_code: $id}})
+OPTIONAL MATCH (th:Theme {{theme_name: $id}})
+FOREACH (_ IN CASE WHEN t IS NULL THEN [] ELSE [1] END | MERGE (e)-[:{rel}]->(t))
+FOREACH (_ IN CASE WHEN s IS NULL THEN [] ELSE [1] END | MERGE (e)-[:{rel}]->(s))
+FOREACH (_ IN CASE WHEN th IS NULL THEN [] ELSE [1] END | MERGE (e)-[:{rel}]->(th))
+"""
+_LINK_QUERIES = {
+    rel: _LINK_QUERY_TEMPLATE.format(rel=rel)
+    for rel in ("MENTIONS", "AFFECTS", "TRIGGERS")
+}
+
+_CREATE_EVENTS_BATCH_QUERY = """
+UNWIND $batch AS e
+CREATE (ev:Event {
+    summary: e.summary,
+    sentiment_score: e.sentiment,
+    date: date(e.date),
+    created_at: datetime(),
+    embedding: coalesce(e.embedding, [])
+})
+RETURN elementId(ev) AS id
+"""
+
+_LINK_EVENTS_BATCH_QUERY = """
+UNWIND $batch AS r
+MATCH (e:Event) WHERE elementId(e) = r.eid
+WITH e, r
+MATCH (t:Ticker {ticker: r.id})
+MERGE (e)-[:MENTIONS]->(t)
+"""
+
 class EventService:
     def __init__(self):
         self.client = graph_client
@@ -33,36 +71,39 @@ class EventService:
             "date": date,
             "embedding": embedding or []
         }
-        result = self.client.run_query(query, params)
+        result = self.client.run_write(query, params)
         return result[0]['id'] if result else None
 
+    def create_events_batch(self, events: List[Dict]) -> List[str]:
+        """
+        이벤트 노드 일괄 생성 (UNWIND, 왕복 1회).
+        events: [{"summary", "sentiment", "date", "embedding"(선택)}, ...]
+        Returns: 입력 순서대로의 event_id 리스트
+        """
+        if not events:
+            return []
+        rows = self.client.run_batch_return(_CREATE_EVENTS_BATCH_QUERY, events)
+        return [row["id"] for row in rows]
+
+    def link_events_batch(self, pairs: List[Dict]) -> int:
+        """
+        이벤트 → 종목 MENTIONS 관계 일괄 연결.
+        pairs: [{"eid": event_id, "id": ticker}, ...]
+        """
+        if not pairs:
+            return 0
+        return self.client.run_batch(_LINK_EVENTS_BATCH_QUERY, pairs)
+
     def link_event_to_entity(self, event_id: str, identifier: str, relationship_type: str = "MENTIONS"):
         """
         이벤트와 엔티티(Ticker, Sector, Theme) 연결
         identifier: Ticker symbol, Sector code, or Theme name
         relationship_type: MENTIONS, AFFECTS, TRIGGERS
         """
-        # Ticker
-        query = f"""
-        MATCH (e:Event) WHERE elementId(e) = $eid
-        MATCH (t:Ticker {{ticker: $id}})
-        MERGE (e)-[:{relationship_type}]->(t)
-        """
-        self.client.run_query(query, {"eid": event_id, "id": identifier})
-        
-        # Sector
-        self.client.run_query(f"""
-        MATCH (e:Event) WHERE elementId(e) = $eid
-        MATCH (s:Sector {{sector_code: $id}})
-        MERGE (e)-[:{relationship_type}]->(s)
-        """, {"eid": event_id, "id": identifier})
-
-        # Theme
-        self.client.run_query(f"""
-        MATCH (e:Event) WHERE elementId(e) = $eid
-        MATCH (th:Theme {{theme_name: $id}})
-        MERGE (e)-[:{relationship_type}]->(th)
-        """, {"eid": event_id, "id": identifier})
+        query = _LINK_QUERIES.get(relationship_type)
+        if query is None:
+            raise ValueError(f"Unsupported relationship_type: {relationship_type}")
+        self.client.run_write(query, {"eid": event_id, "id": identifier})
 
     def get_ticker_impact(self, ticker: str, current_date: str = None, days: int = 7) -> float:
         """
@@ -72,43 +113,39 @@ class EventService:
         if not current_date:
             current_date = datetime.now().strftime("%Y-%m-%d")
 
-        fetch_query = """
-        // 1. Direct
-        MATCH (t:Ticker {ticker: $ticker})
-        OPTIONAL MATCH (e1:Event)-[:MENTIONS]->(t)
-        WHERE e1.date >= date($date) - duration({days: $days}) AND e1.date <= date($date)
-        RETURN 'direct' as type, e1.sentiment_score as score
-        
-        UNION ALL
-        
-        // 2. Supply Chain (Supplier)
-        MATCH (t:Ticker {ticker: $ticker})
-        OPTIONAL MATCH (e2:Event)-[:MENTIONS]->(s:Ticker)-[:SUPPLIES_TO]->(t)
-        WHERE e2.date >= date($date) - duration({days: $days}) AND e2.date <= date($date)
-        RETURN 'supplier' as type, e2.sentiment_score as score
-        
-        UNION ALL
-        
-        // 3. Theme
+        # 경로별 가중합을 Cypher 안에서 집계해 한 행만 받는다
+        # (직접 1.0 / 공급사 0.5 / 테마 0.3)
+        query = """
         MATCH (t:Ticker {ticker: $ticker})
-        OPTIONAL MATCH (e3:Event)-[:TRIGGERS]->(th:Theme)<-[:IN_THEME]-(t)
-        WHERE e3.date >= date($date) - duration({days: $days}) AND e3.date <= date($date)
-        RETURN 'theme' as type, e3.sentiment_score as score
+        USING INDEX t:Ticker(ticker)
+        CALL {
+            // 1. Direct
+            WITH t
+            OPTIONAL MATCH (e1:Event)-[:MENTIONS]->(t)
+            WHERE e1.date >= date($date) - duration({days: $days}) AND e1.date <= date($date)
+            RETURN sum(coalesce(e1.sentiment_score, 0)) * 1.0 AS s
+
+            UNION ALL
+
+            // 2. Supply Chain (Supplier)
+            WITH t
+            OPTIONAL MATCH (e2:Event)-[:MENTIONS]->(:Ticker)-[:SUPPLIES_TO]->(t)
+            WHERE e2.date >= date($date) - duration({days: $days}) AND e2.date <= date($date)
+            RETURN sum(coalesce(e2.sentiment_score, 0)) * 0.5 AS s
+
+            UNION ALL
+
+            // 3. Theme
+            WITH t
+            OPTIONAL MATCH (e3:Event)-[:TRIGGERS]->(:Theme)<-[:IN_THEME]-(t)
+            WHERE e3.date >= date($date) - duration({days: $days}) AND e3.date <= date($date)
+            RETURN sum(coalesce(e3.sentiment_score, 0)) * 0.3 AS s
+        }
+        RETURN sum(s) AS total
         """
-        
-        results = self.client.run_query(fetch_query, {"ticker": ticker, "days": days, "date": current_date})
-        
-        total_score = 0.0
-        for r in results:
-            score = float(r.get('score') or 0)
-            if r['type'] == 'direct':
-                total_score += score * 1.0
-            elif r['type'] == 'supplier':
-                total_score += score * 0.5
-            elif r['type'] == 'theme':
-                total_score += score * 0.3
-                
-        return total_score
+
+        results = self.client.run_query(query, {"ticker": ticker, "days": days, "date": current_date})
+        return float(results[0]['total'] or 0.0) if results else 0.0
 
     def get_theme_impact(self, theme_name: str, current_date: str = None, days: int = 7) -> float:
         """
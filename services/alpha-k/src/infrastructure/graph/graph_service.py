@@ -11,13 +11,199 @@ Neo4j에 저장된 관계형 데이터를 에이전트가 활용할 수 있는
   - 공급망 조회 (RiskAgent)
   - 지배구조 조회
 """
+import copy
+import functools
 import logging
+import threading
 from typing import Dict, List, Optional
 
+from cachetools import TTLCache
+
 from .neo4j_client import graph_client
 
 logger = logging.getLogger(__name__)
 
+# 테마/경쟁사/공급망/지배구조는 거의 바뀌지 않는 마스터 데이터 → 프로세스 내 TTL 캐시
+GRAPH_CACHE_TTL = 300
+_GRAPH_CACHE = TTLCache(maxsize=4096, ttl=GRAPH_CACHE_TTL)
+_GRAPH_CACHE_LOCK = threading.Lock()
+
+
+def _cypher(query: str) -> str:
+    """공백을 정규화한 Cypher 문. 모듈 로드 시 한 번만 만들어 서버 쿼리 캐시 키를 프로세스 간 동일하게 유지한다."""
+    return " ".join(query.split())
+
+
+_Q_ALL_THEMES = _cypher("""
+MATCH (theme:Theme)<-[:BELONGS_TO]-(t:Ticker)
+RETURN theme.name AS theme_name,
+       theme.category AS category,
+       COUNT(t) AS ticker_count
+ORDER BY ticker_count DESC
+""")
+
+_Q_THEME_TICKERS = _cypher("""
+MATCH (t:Ticker)-[:BELONGS_TO]->(theme:Theme {name: $theme_name})
+RETURN t.code AS ticker_code, t.name AS ticker_name
+ORDER BY t.name
+""")
+
+_Q_TOP_THEMES_WITH_TICKERS = _cypher("""
+MATCH (t:Ticker)-[:BELONGS_TO]->(theme:Theme)
+WITH theme, COLLECT({code: t.code, name: t.name}) AS tickers,
+     COUNT(t) AS cnt
+ORDER BY cnt DESC
+LIMIT $limit
+RETURN theme.name AS theme_name,
+       theme.category AS category,
+       tickers, cnt AS ticker_count
+""")
+
+_Q_TICKER_THEMES = _cypher("""
+MATCH (t:Ticker {code: $code})-[:BELONGS_TO]->(theme:Theme)
+RETURN theme.name AS theme_name
+""")
+
+# Ticker(code) 는 seed_graph 의 유니크 제약(인덱스 기반)으로 seek, peer 별로 한 번만 집계
+_Q_THEME_PEERS = _cypher("""
+MATCH (t:Ticker {code: $code})
+USING INDEX t:Ticker(code)
+MATCH (t)-[:BELONGS_TO]->(theme:Theme)<-[:BELONGS_TO]-(peer:Ticker)
+WHERE peer.code <> $code
+WITH peer, COLLECT(theme.name) AS shared_themes, COUNT(theme) AS k
+ORDER BY k DESC
+RETURN peer.code AS ticker_code, peer.name AS ticker_name, shared_themes
+""")
+
+_Q_COMPETITORS = _cypher("""
+MATCH (t:Ticker {code: $code})-[r:COMPETES_WITH]-(comp:Ticker)
+RETURN comp.code AS ticker_code, comp.name AS ticker_name,
+       r.domain AS domain
+""")
+
+_Q_SUPPLIERS = _cypher("""
+MATCH (supplier:Ticker)-[r:SUPPLIES_TO]->(t:Ticker {code: $code})
+RETURN supplier.code AS ticker_code, supplier.name AS ticker_name,
+       r.product AS product
+""")
+
+_Q_CUSTOMERS = _cypher("""
+MATCH (t:Ticker {code: $code})-[r:SUPPLIES_TO]->(customer:Ticker)
+RETURN customer.code AS ticker_code, customer.name AS ticker_name,
+       r.product AS product
+""")
+
+_Q_SUPPLY_CHAIN_RISK = _cypher("""
+CALL {
+    MATCH (t:Ticker {code: $code})-[:SUPPLIES_TO]-(r1:Ticker)
+    WHERE r1.code <> $code
+    RETURN DISTINCT r1.code AS ticker_code, r1.name AS ticker_name, 1 AS depth
+    UNION
+    MATCH (t:Ticker {code: $code})-[:SUPPLIES_TO]-(:Ticker)-[:SUPPLIES_TO]-(r2:Ticker)
+    WHERE r2.code <> $code
+    RETURN DISTINCT r2.code AS ticker_code, r2.name AS ticker_name, 2 AS depth
+}
+RETURN ticker_code, ticker_name, depth
+ORDER BY depth
+""")
+
+_Q_SUBSIDIARIES = _cypher("""
+MATCH (parent:Company {name: $name})<-[:SUBSIDIARY_OF]-(child)
+OPTIONAL MATCH (child)<-[:IS_TICKER]-(ticker:Ticker)
+RETURN child.name AS subsidiary_name,
+       ticker.code AS ticker_code,
+       ticker.name AS ticker_name
+""")
+
+_Q_PARENT_COMPANY = _cypher("""
+MATCH (t:Ticker {code: $code})-[:IS_TICKER]->(c:Company)-[:SUBSIDIARY_OF]->(parent:Company)
+RETURN parent.name AS parent_name, c.name AS company_name
+""")
+
+_Q_GROUP_TICKERS = _cypher("""
+MATCH (t:Ticker {code: $code})-[:IS_TICKER]->(c:Company)-[:SUBSIDIARY_OF]->(parent:Company)
+MATCH (parent)<-[:SUBSIDIARY_OF]-(sibling:Company)<-[:IS_TICKER]-(peer:Ticker)
+WHERE peer.code <> $code
+RETURN DISTINCT peer.code AS ticker_code, peer.name AS ticker_name,
+       sibling.name AS company_name
+""")
+
+_Q_RELATED_TICKERS_ALL = _cypher("""
+MATCH (t:Ticker {code: $code})
+CALL {
+    WITH t
+    MATCH (t)-[:BELONGS_TO]->(theme:Theme)
+    RETURN COLLECT(theme.name) AS themes
+}
+CALL {
+    WITH t
+    MATCH (t)-[:BELONGS_TO]->(theme:Theme)<-[:BELONGS_TO]-(peer:Ticker)
+    WHERE peer.code <> $code
+    WITH peer, COLLECT(DISTINCT theme.name) AS shared_themes
+    ORDER BY SIZE(shared_themes) DESC
+    RETURN COLLECT({ticker_code: peer.code, ticker_name: peer.name,
+                    shared_themes: shared_themes}) AS theme_peers
+}
+CALL {
+    WITH t
+    MATCH (t)-[r:COMPETES_WITH]-(comp:Ticker)
+    RETURN COLLECT({ticker_code: comp.code, ticker_name: comp.name,
+                    domain: r.domain}) AS competitors
+}
+CALL {
+    WITH t
+    MATCH (supplier:Ticker)-[r:SUPPLIES_TO]->(t)
+    RETURN COLLECT({ticker_code: supplier.code, ticker_name: supplier.name,
+                    product: r.product}) AS suppliers
+}
+CALL {
+    WITH t
+    MATCH (t)-[r:SUPPLIES_TO]->(customer:Ticker)
+    RETURN COLLECT({ticker_code: customer.code, ticker_name: customer.name,
+                    product: r.product}) AS customers
+}
+CALL {
+    WITH t
+    MATCH (t)-[:IS_TICKER]->(:Company)-[:SUBSIDIARY_OF]->(parent:Company)
+    MATCH (parent)<-[:SUBSIDIARY_OF]-(sibling:Company)<-[:IS_TICKER]-(peer:Ticker)
+    WHERE peer.code <> $code
+    WITH DISTINCT peer, sibling
+    RETURN COLLECT({ticker_code: peer.code, ticker_name: peer.name,
+                    company_name: sibling.name}) AS group_peers
+}
+RETURN themes, theme_peers, competitors, suppliers, customers, group_peers
+""")
+
+_Q_SEARCH_THEME = _cypher("""
+MATCH (theme:Theme)
+WHERE theme.name CONTAINS $keyword
+RETURN theme.name AS theme_name, theme.category AS category
+""")
+
+
+def _ttl_cached(fn):
+    """
+    읽기 전용 조회 결과를 (메서드명, 인자) 키로 캐시한다. 빈 결과(연결 실패 포함)는 캐시하지 않는다.
+    호출자가 결과를 정렬/추가해도 캐시가 바뀌지 않도록 얕은 복사본을 돌려준다.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(self, *args):
+        key = (fn.__name__, *args)
+        with _GRAPH_CACHE_LOCK:
+            value = _GRAPH_CACHE.get(key)
+        if value is not None:
+            return copy.copy(value)
+
+        value = fn(self, *args)
+        if value:
+            with _GRAPH_CACHE_LOCK:
+                _GRAPH_CACHE[key] = value
+            return copy.copy(value)
+        return value
+
+    return wrapper
+
 
 class GraphService:
     """Neo4j 관계형 데이터를 에이전트에 제공하는 서비스 계층."""
@@ -29,98 +215,61 @@ class GraphService:
     def is_available(self) -> bool:
         return self.client.is_connected
 
+    def invalidate(self):
+        """조회 캐시 비우기 (그래프 쓰기/재시드 후 호출)."""
+        with _GRAPH_CACHE_LOCK:
+            _GRAPH_CACHE.clear()
+
     # ─────────────────────────────────────────────
     # Theme ↔ Ticker
     # ─────────────────────────────────────────────
 
+    @_ttl_cached
     def get_all_themes(self) -> List[Dict]:
         """모든 테마와 소속 종목 수를 반환."""
-        query = """
-        MATCH (theme:Theme)<-[:BELONGS_TO]-(t:Ticker)
-        RETURN theme.name AS theme_name,
-               theme.category AS category,
-               COUNT(t) AS ticker_count
-        ORDER BY ticker_count DESC
-        """
-        return self.client.run_query(query)
+        return self.client.run_query(_Q_ALL_THEMES, read=True)
 
+    @_ttl_cached
     def get_theme_tickers(self, theme_name: str) -> List[Dict]:
         """특정 테마에 속한 종목 리스트 반환."""
-        query = """
-        MATCH (t:Ticker)-[:BELONGS_TO]->(theme:Theme {name: $theme_name})
-        RETURN t.code AS ticker_code, t.name AS ticker_name
-        ORDER BY t.name
-        """
-        return self.client.run_query(query, {"theme_name": theme_name})
+        return self.client.run_query(_Q_THEME_TICKERS, {"theme_name": theme_name}, read=True)
 
     def get_top_themes_with_tickers(self, limit: int = 10) -> List[Dict]:
         """종목 수 기준 상위 테마와 그 종목 리스트 반환."""
-        query = """
-        MATCH (t:Ticker)-[:BELONGS_TO]->(theme:Theme)
-        WITH theme, COLLECT({code: t.code, name: t.name}) AS tickers,
-             COUNT(t) AS cnt
-        ORDER BY cnt DESC
-        LIMIT $limit
-        RETURN theme.name AS theme_name,
-               theme.category AS category,
-               tickers, cnt AS ticker_count
-        """
-        return self.client.run_query(query, {"limit": limit})
+        return self.client.run_query(_Q_TOP_THEMES_WITH_TICKERS, {"limit": limit}, read=True)
 
+    @_ttl_cached
     def get_ticker_themes(self, ticker_code: str) -> List[str]:
         """종목이 속한 모든 테마 이름 반환."""
-        query = """
-        MATCH (t:Ticker {code: $code})-[:BELONGS_TO]->(theme:Theme)
-        RETURN theme.name AS theme_name
-        """
-        results = self.client.run_query(query, {"code": ticker_code})
+        results = self.client.run_query(_Q_TICKER_THEMES, {"code": ticker_code}, read=True)
         return [r["theme_name"] for r in results]
 
     def get_theme_peers(self, ticker_code: str) -> List[Dict]:
         """같은 테마에 속한 다른 종목(동료 종목) 반환."""
-        query = """
-        MATCH (t:Ticker {code: $code})-[:BELONGS_TO]->(theme:Theme)<-[:BELONGS_TO]-(peer:Ticker)
-        WHERE peer.code <> $code
-        RETURN DISTINCT peer.code AS ticker_code, peer.name AS ticker_name,
-               COLLECT(DISTINCT theme.name) AS shared_themes
-        ORDER BY SIZE(shared_themes) DESC
-        """
-        return self.client.run_query(query, {"code": ticker_code})
+        return self.client.run_query(_Q_THEME_PEERS, {"code": ticker_code}, read=True)
 
     # ─────────────────────────────────────────────
     # Competitors
     # ─────────────────────────────────────────────
 
+    @_ttl_cached
     def get_competitors(self, ticker_code: str) -> List[Dict]:
         """종목의 경쟁사 리스트 반환 (도메인 포함)."""
-        query = """
-        MATCH (t:Ticker {code: $code})-[r:COMPETES_WITH]-(comp:Ticker)
-        RETURN comp.code AS ticker_code, comp.name AS ticker_name,
-               r.domain AS domain
-        """
-        return self.client.run_query(query, {"code": ticker_code})
+        return self.client.run_query(_Q_COMPETITORS, {"code": ticker_code}, read=True)
 
     # ─────────────────────────────────────────────
     # Supply Chain
     # ─────────────────────────────────────────────
 
+    @_ttl_cached
     def get_suppliers(self, ticker_code: str) -> List[Dict]:
         """이 종목에 공급하는 업체 리스트."""
-        query = """
-        MATCH (supplier:Ticker)-[r:SUPPLIES_TO]->(t:Ticker {code: $code})
-        RETURN supplier.code AS ticker_code, supplier.name AS ticker_name,
-               r.product AS product
-        """
-        return self.client.run_query(query, {"code": ticker_code})
+        return self.client.run_query(_Q_SUPPLIERS, {"code": ticker_code}, read=True)
 
+    @_ttl_cached
     def get_customers(self, ticker_code: str) -> List[Dict]:
         """이 종목이 공급하는 고객사 리스트."""
-        query = """
-        MATCH (t:Ticker {code: $code})-[r:SUPPLIES_TO]->(customer:Ticker)
-        RETURN customer.code AS ticker_code, customer.name AS ticker_name,
-               r.product AS product
-        """
-        return self.client.run_query(query, {"code": ticker_code})
+        return self.client.run_query(_Q_CUSTOMERS, {"code": ticker_code}, read=True)
 
     def get_full_supply_chain(self, ticker_code: str) -> Dict:
         """상위(공급자) + 하위(고객사) 전체 공급망 반환."""
@@ -131,14 +280,8 @@ class GraphService:
 
     def get_supply_chain_risk(self, ticker_code: str) -> List[Dict]:
         """공급망 내 연결된 모든 종목 (2-hop depth)."""
-        query = """
-        MATCH path = (t:Ticker {code: $code})-[:SUPPLIES_TO*1..2]-(related:Ticker)
-        WHERE related.code <> $code
-        RETURN DISTINCT related.code AS ticker_code, related.name AS ticker_name,
-               LENGTH(path) AS depth
-        ORDER BY depth
-        """
-        return self.client.run_query(query, {"code": ticker_code})
+        # 가변 길이 경로(*1..2) 대신 1-hop / 2-hop 을 고정 패턴으로 나눠 path 객체 생성을 피한다
+        return self.client.run_query(_Q_SUPPLY_CHAIN_RISK, {"code": ticker_code}, read=True)
 
     # ─────────────────────────────────────────────
     # Ownership / Group Structure
@@ -146,34 +289,18 @@ class GraphService:
 
     def get_subsidiaries(self, company_name: str) -> List[Dict]:
         """그룹사의 자회사 종목 리스트."""
-        query = """
-        MATCH (parent:Company {name: $name})<-[:SUBSIDIARY_OF]-(child)
-        OPTIONAL MATCH (child)<-[:IS_TICKER]-(ticker:Ticker)
-        RETURN child.name AS subsidiary_name,
-               ticker.code AS ticker_code,
-               ticker.name AS ticker_name
-        """
-        return self.client.run_query(query, {"name": company_name})
+        return self.client.run_query(_Q_SUBSIDIARIES, {"name": company_name}, read=True)
 
+    @_ttl_cached
     def get_parent_company(self, ticker_code: str) -> Optional[Dict]:
         """종목의 모회사/그룹 반환."""
-        query = """
-        MATCH (t:Ticker {code: $code})-[:IS_TICKER]->(c:Company)-[:SUBSIDIARY_OF]->(parent:Company)
-        RETURN parent.name AS parent_name, c.name AS company_name
-        """
-        results = self.client.run_query(query, {"code": ticker_code})
+        results = self.client.run_query(_Q_PARENT_COMPANY, {"code": ticker_code}, read=True)
         return results[0] if results else None
 
+    @_ttl_cached
     def get_group_tickers(self, ticker_code: str) -> List[Dict]:
         """같은 그룹에 속한 다른 종목 리스트."""
-        query = """
-        MATCH (t:Ticker {code: $code})-[:IS_TICKER]->(c:Company)-[:SUBSIDIARY_OF]->(parent:Company)
-        MATCH (parent)<-[:SUBSIDIARY_OF]-(sibling:Company)<-[:IS_TICKER]-(peer:Ticker)
-        WHERE peer.code <> $code
-        RETURN DISTINCT peer.code AS ticker_code, peer.name AS ticker_name,
-               sibling.name AS company_name
-        """
-        return self.client.run_query(query, {"code": ticker_code})
+        return self.client.run_query(_Q_GROUP_TICKERS, {"code": ticker_code}, read=True)
 
     # ─────────────────────────────────────────────
     # Advanced Queries (for Agents)
@@ -186,22 +313,30 @@ class GraphService:
 
     def get_related_tickers_all(self, ticker_code: str) -> Dict:
         """종목과 관계있는 모든 종목을 관계 유형별로 반환."""
+        return self.get_related_tickers_all_fast(ticker_code)
+
+    def get_related_tickers_all_fast(self, ticker_code: str) -> Dict:
+        """
+        get_related_tickers_all 의 단일 쿼리 버전.
+        관계 유형별 조회를 CALL 서브쿼리로 묶어 한 번의 왕복으로 가져온다 (반환 형태는 개별 메서드와 동일).
+        """
+        results = self.client.run_query(_Q_RELATED_TICKERS_ALL, {"code": ticker_code}, read=True)
+        row = results[0] if results else {}
         return {
-            "themes": self.get_ticker_themes(ticker_code),
-            "theme_peers": self.get_theme_peers(ticker_code),
-            "competitors": self.get_competitors(ticker_code),
-            "supply_chain": self.get_full_supply_chain(ticker_code),
-            "group_peers": self.get_group_tickers(ticker_code),
+            "themes": row.get("themes", []),
+            "theme_peers": row.get("theme_peers", []),
+            "competitors": row.get("competitors", []),
+            "supply_chain": {
+                "suppliers": row.get("suppliers", []),
+                "customers": row.get("customers", []),
+            },
+            "group_peers": row.get("group_peers", []),
         }
 
+    @_ttl_cached
     def search_theme(self, keyword: str) -> List[Dict]:
         """키워드로 테마 검색 (부분 일치)."""
-        query = """
-        MATCH (theme:Theme)
-        WHERE theme.name CONTAINS $keyword
-        RETURN theme.name AS theme_name, theme.category AS category
-        """
-        return self.client.run_query(query, {"keyword": keyword})
+        return self.client.run_query(_Q_SEARCH_THEME, {"keyword": keyword}, read=True)
 
 
 # Singleton instance
@@ -10,12 +10,29 @@ Usage:
 """
 import os
 import logging
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
 
-from neo4j import GraphDatabase
+from neo4j import READ_ACCESS, WRITE_ACCESS, GraphDatabase, RoutingControl
+
+from ..circuit_breaker import CircuitBreaker
 
 logger = logging.getLogger(__name__)
 
+# EventService / GraphService 조회 경로용 인덱스 (인덱스는 seed_graph 의 제약조건 이름과 겹치지 않게 *_idx 로 명명)
+_STARTUP_INDEXES = [
+    "CREATE INDEX ticker_ticker_idx IF NOT EXISTS FOR (t:Ticker) ON (t.ticker)",
+    "CREATE INDEX event_date_idx IF NOT EXISTS FOR (e:Event) ON (e.date)",
+    "CREATE INDEX theme_theme_name_idx IF NOT EXISTS FOR (th:Theme) ON (th.theme_name)",
+    "CREATE INDEX sector_code_idx IF NOT EXISTS FOR (s:Sector) ON (s.sector_code)",
+    # GraphService 의 USING INDEX t:Ticker(code) 힌트용. seed_graph._Q_CONSTRAINTS 와 같은 이름/정의라
+    # 어느 쪽이 먼저 실행돼도 IF NOT EXISTS 로 하나만 생긴다 (시드 전에 API 가 떠도 힌트가 유효)
+    "CREATE CONSTRAINT ticker_code IF NOT EXISTS FOR (t:Ticker) REQUIRE t.code IS UNIQUE",
+]
+# CREATE INDEX 는 인덱스가 ONLINE 되기 전에 반환된다. 채우는 중에 USING INDEX 힌트 쿼리가 오면
+# 플래닝이 실패(→ 브레이커 실패로 집계)하므로 ONLINE 까지 기다린다 (초, seed_graph 와 같은 방식)
+_STARTUP_INDEX_WAIT_SEC = int(os.getenv("NEO4J_INDEX_WAIT_SEC", "120"))
+
 
 class Neo4jClient:
     """Neo4j Graph Database 클라이언트 (Singleton)."""
@@ -50,48 +67,167 @@ class Neo4jClient:
             # Let's align with DB client strictness but maybe just log error if it's optional feature.
             # Given it's "infrastructure", let's assume it should be configured if used.
 
+        self._breaker = CircuitBreaker("neo4j")
+        # execute_query 호출 간 인과적 일관성 (클러스터에서 앞선 쓰기를 다음 쿼리가 보도록)
+        self._bookmarks = GraphDatabase.bookmark_manager()
+        self.driver = None
+        self._connect()
 
+    def _connect(self):
+        """드라이버 생성 + 연결 확인. 실패하면 driver=None (run_query 가 브레이커 허용 시 재시도)."""
         try:
-            self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
+            self.driver = GraphDatabase.driver(
+                self.uri,
+                auth=(self.user, self.password),
+                max_connection_pool_size=int(os.getenv("NEO4J_POOL_SIZE", "50")),
+                connection_acquisition_timeout=30,
+                max_connection_lifetime=3600,
+                connection_timeout=10,
+                fetch_size=1000,
+            )
             self.driver.verify_connectivity()
             logger.info(f"[Neo4j] Connected to {self.uri}")
         except Exception as e:
             logger.error(f"[Neo4j] Connection failed: {e}")
+            if self.driver:
+                self.driver.close()
             self.driver = None
+            return
+
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """조회 쿼리가 NodeByLabelScan 대신 NodeIndexSeek 를 타도록 인덱스를 보장한다."""
+        try:
+            with self.driver.session() as session:
+                for ddl in _STARTUP_INDEXES:
+                    try:
+                        session.run(ddl).consume()
+                    except Exception as e:
+                        # 예: 중복 code 가 있는 DB 에서는 제약 조건 생성이 실패 → 나머지 인덱스는 계속
+                        logger.warning(f"[Neo4j] Index creation failed ({ddl}): {e}")
+                session.run("CALL db.awaitIndexes($sec)", sec=_STARTUP_INDEX_WAIT_SEC).consume()
+        except Exception as e:
+            logger.warning(f"[Neo4j] Index setup failed: {e}")
 
     def close(self):
         if self.driver:
             self.driver.close()
 
     def run_query(
-        self, query: str, parameters: dict = None, database: str = "neo4j"
+        self, query: str, parameters: dict = None, database: str = "neo4j", read: bool = True
     ) -> List[Dict[str, Any]]:
-        """Cypher 쿼리 실행. 결과를 dict 리스트로 반환."""
+        """
+        Cypher 쿼리 실행. 결과를 dict 리스트로 반환.
+        read=True 면 READ 세션의 managed read 트랜잭션으로 실행해 클러스터에서 follower 로 라우팅된다.
+        쓰기 쿼리는 read=False (= run_write) 로 leader 에 보낸다.
+        """
+        if not read:
+            return self.run_write(query, parameters, database)
+        if not self._breaker.allow():
+            return []
+        if not self.driver and self.uri:
+            self._connect()  # 기동 시 연결 실패 → 재연결 시도
         if not self.driver:
             logger.error("[Neo4j] Driver not initialized")
+            self._breaker.record_failure()
             return []
 
         try:
-            with self.driver.session(database=database) as session:
-                result = session.run(query, parameters or {})
-                return [record.data() for record in result]
+            with self.driver.session(database=database, default_access_mode=READ_ACCESS) as session:
+                records = session.execute_read(
+                    lambda tx: [record.data() for record in tx.run(query, parameters or {})]
+                )
         except Exception as e:
             logger.error(f"[Neo4j] Query error: {e}")
+            self._breaker.record_failure()
             return []
 
+        self._breaker.record_success()
+        return records
+
     def run_write(
         self, query: str, parameters: dict = None, database: str = "neo4j"
-    ) -> None:
-        """쓰기 전용 Cypher 쿼리 실행."""
+    ) -> List[Dict[str, Any]]:
+        """쓰기 전용 Cypher 쿼리 실행. RETURN 이 있으면 결과를 dict 리스트로 반환."""
         if not self.driver:
             logger.error("[Neo4j] Driver not initialized")
-            return
+            return []
 
         try:
             with self.driver.session(database=database) as session:
-                session.execute_write(lambda tx: tx.run(query, parameters or {}))
+                return session.execute_write(
+                    lambda tx: [record.data() for record in tx.run(query, parameters or {})]
+                )
+        except Exception as e:
+            logger.error(f"[Neo4j] Write error: {e}")
+            return []
+
+    def execute_query(
+        self, query: str, parameters: dict = None, database: str = "neo4j", read: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        driver.execute_query 위임. 세션을 직접 열지 않고 드라이버 풀과 재시도를 그대로 쓴다.
+        모든 호출이 같은 BookmarkManager 를 공유해 단계별 쓰기 순서가 클러스터에서도 보장된다.
+        """
+        if not self.driver:
+            logger.error("[Neo4j] Driver not initialized")
+            return []
+
+        try:
+            records, _, _ = self.driver.execute_query(
+                query,
+                parameters or {},
+                routing_=RoutingControl.READ if read else RoutingControl.WRITE,
+                database_=database,
+                bookmark_manager_=self._bookmarks,
+            )
+            return [record.data() for record in records]
         except Exception as e:
+            logger.error(f"[Neo4j] Query error: {e}")
+            return []
+
+    @contextmanager
+    def batch_session(self, database: str = "neo4j"):
+        """
+        여러 호출이 하나의 WRITE 세션(= 풀 커넥션 1개)을 공유하도록 세션을 연다.
+        세션은 thread-safe 하지 않으므로 한 스레드 안의 연속 작업에만 쓴다.
+        예외는 호출자에게 그대로 전달된다.
+        """
+        if not self.driver:
+            raise RuntimeError("Neo4j driver not initialized")
+        with self.driver.session(
+            database=database, default_access_mode=WRITE_ACCESS, bookmark_manager=self._bookmarks
+        ) as session:
+            yield session
+
+    def execute_write_many(
+        self, pairs: List[Tuple[str, dict]], database: str = "neo4j", raise_errors: bool = False
+    ) -> int:
+        """
+        (cypher, params) 목록을 managed write 트랜잭션 하나에서 순서대로 실행하고 한 번만 커밋한다.
+        뒤 문장은 앞 문장의 쓰기를 본다. Returns: 실행한 문장 수 (실패 시 0)
+        raise_errors=True 면 예외(드라이버 재시도 소진 포함)를 호출자에게 넘긴다.
+        """
+        if not self.driver:
+            if raise_errors:
+                raise RuntimeError("Neo4j driver not initialized")
+            logger.error("[Neo4j] Driver not initialized")
+            return 0
+
+        def _work(tx):
+            for query, params in pairs:
+                tx.run(query, params or {}).consume()
+            return len(pairs)
+
+        try:
+            with self.driver.session(database=database, bookmark_manager=self._bookmarks) as session:
+                return session.execute_write(_work)
+        except Exception as e:
+            if raise_errors:
+                raise
             logger.error(f"[Neo4j] Write error: {e}")
+            return 0
 
     def run_batch(
         self, query: str, batch_params: List[dict], database: str = "neo4j"
@@ -110,6 +246,22 @@ class Neo4jClient:
             logger.error(f"[Neo4j] Batch write error: {e}")
             return 0
 
+    def run_batch_return(
+        self, query: str, batch_params: List[dict], database: str = "neo4j"
+    ) -> List[Dict[str, Any]]:
+        """배치 쓰기 + 결과 반환. UNWIND 쿼리의 RETURN 행을 dict 리스트로 돌려준다."""
+        if not self.driver:
+            return []
+
+        try:
+            with self.driver.session(database=database) as session:
+                return session.execute_write(
+                    lambda tx: [r.data() for r in tx.run(query, {"batch": batch_params})]
+                )
+        except Exception as e:
+            logger.error(f"[Neo4j] Batch write error: {e}")
+            return []
+
     @property
     def is_connected(self) -> bool:
         if not self.driver:
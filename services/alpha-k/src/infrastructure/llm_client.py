@@ -12,6 +12,8 @@ config/llm_config.yaml 설정을 로드하여 에이전트별 맞춤형 클라
 import os
 import yaml
 import logging
+import threading
+from pathlib import Path
 from typing import Optional, Dict, Any, Union
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
@@ -19,31 +21,47 @@ from langchain_core.language_models.chat_models import BaseChatModel
 
 logger = logging.getLogger(__name__)
 
+# 설정 파일 후보 (서비스 루트, src/, 현재 디렉터리 순). 모듈 로드 시 한 번만 계산
+_HERE = Path(__file__).resolve()
+_CONFIG_CANDIDATES = [
+    _HERE.parents[2] / "config" / "llm_config.yaml",
+    _HERE.parents[1] / "config" / "llm_config.yaml",
+    Path("config/llm_config.yaml"),
+]
+
+# libyaml C 바인딩이 있으면 사용 (순수 Python SafeLoader 대비 수 배 빠름)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _read_config(path: str) -> Dict[str, Any]:
+    """YAML 설정을 읽는다 (CSafeLoader 우선)."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER) or {}
+
+
 class LLMClient:
     _instance = None
     _llm_instances: Dict[str, BaseChatModel] = {}
     _config: Dict[str, Any] = {}
+    # 싱글턴 생성/설정 로드와 에이전트별 인스턴스 생성을 직렬화 (조회 hot path 는 lock 없이)
+    _lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(LLMClient, cls).__new__(cls)
-            cls._instance._load_config()
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(LLMClient, cls).__new__(cls)
+                    instance._load_config()
+                    cls._instance = instance
         return cls._instance
 
     def _load_config(self):
         """config/llm_config.yaml 로드"""
         try:
-            # 다양한 경로 시도 (root, src/.., current dir)
-            possible_paths = [
-                os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "config", "llm_config.yaml"),
-                os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "llm_config.yaml"),
-                "config/llm_config.yaml",
-            ]
-            
-            for path in possible_paths:
-                if os.path.exists(path):
-                    with open(path, "r", encoding="utf-8") as f:
-                        self._config = yaml.safe_load(f)
+            # 다양한 경로 시도 (root, src/.., current dir) — 처음 찾은 파일에서 중단
+            for path in _CONFIG_CANDIDATES:
+                if path.is_file():
+                    self._config = _read_config(str(path))
                     logger.info(f"[LLMClient] Loaded config from {path}")
                     return
 
@@ -60,9 +78,18 @@ class LLMClient:
         이미 생성된 인스턴스가 있다면 재사용하고, 없다면 새로 생성한다.
         설정 우선순위: agents.{name} > defaults > hardcoded fallback
         """
-        if agent_name in self._llm_instances:
-            return self._llm_instances[agent_name]
+        llm = self._llm_instances.get(agent_name)
+        if llm is not None:
+            return llm
+
+        with self._lock:
+            # 대기 중 다른 스레드가 먼저 만들었으면 그대로 사용 (ChatOpenAI 중복 생성 방지)
+            if agent_name in self._llm_instances:
+                return self._llm_instances[agent_name]
+            return self._build_agent_llm(agent_name)
 
+    def _build_agent_llm(self, agent_name: str) -> Optional[BaseChatModel]:
+        """설정을 병합해 에이전트 LLM 을 만들고 등록한다. _lock 을 잡은 상태에서 호출."""
         # 설정 병합 (Default + Agent Specific)
         defaults = self._config.get("defaults", {})
         agent_cfg = self._config.get("agents", {}).get(agent_name, {})
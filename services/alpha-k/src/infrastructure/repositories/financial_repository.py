@@ -4,138 +4,123 @@ Financial Statement Repository
 Handles database operations for financial data.
 """
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Sequence, Tuple
+
+from psycopg2.extras import RealDictCursor
+
 from ..db.db_client import db_client
 
 logger = logging.getLogger(__name__)
 
+# financial_statements 의 값 컬럼 (입력 dict 키와 이름이 같다)
+_FIN_VALUE_COLS = (
+    'total_assets', 'total_liabilities', 'total_equity',
+    'current_assets', 'current_liabilities',
+    'revenue', 'operating_income', 'net_income', 'gross_profit',
+    'operating_cash_flow', 'total_shares',
+    'eps', 'bps', 'gross_margin', 'operating_margin', 'net_margin',
+    'roa', 'roe', 'current_ratio', 'debt_ratio', 'asset_turnover',
+)
+
+# get_latest_financials 가 돌려주는 컬럼 (dict 키 순서)
+_FIN_COLS = ('period_code',) + _FIN_VALUE_COLS
+_FIN_SELECT_ALL = ", ".join(_FIN_COLS)
+
+_FIN_UPSERT_SQL = f"""
+INSERT INTO financial_statements (
+    ticker_code, period_code, report_type, {', '.join(_FIN_VALUE_COLS)}, updated_at
+) VALUES %s
+ON CONFLICT (ticker_code, period_code, report_type)
+DO UPDATE SET
+    {', '.join(f'{col} = EXCLUDED.{col}' for col in _FIN_VALUE_COLS)},
+    updated_at = NOW();
+"""
+
+_FIN_UPSERT_TEMPLATE = "(" + ", ".join(["%s"] * (3 + len(_FIN_VALUE_COLS))) + ", NOW())"
+
+
 class FinancialRepository:
     def __init__(self, db=None):
         self.db = db or db_client
 
-    def save_financial_statement(self, ticker: str, data: Dict[str, Any]):
+    def save_financial_statement(self, ticker: str, data: Dict[str, Any]) -> bool:
         """
         Upsert a financial statement record.
         Args:
             ticker: Stock ticker
             data: Dictionary containing fields from the financial_statements table schema
                   e.g. {'period_code': '2023.12', 'total_assets': ..., ...}
+        Returns: True if the row was saved
+        """
+        row = self._fin_row(ticker, data)
+        return row is not None and self._save_row(row)
+
+    def _save_row(self, row: tuple) -> bool:
+        try:
+            return self.db.execute_values(_FIN_UPSERT_SQL, [row], template=_FIN_UPSERT_TEMPLATE) == 1
+        except Exception as e:
+            logger.error("[FinancialRepo] Save failed for %s-%s: %s", row[0], row[1], e)
+            return False
+
+    @staticmethod
+    def _fin_row(ticker: str, data: Dict[str, Any]) -> Optional[tuple]:
+        """INSERT 컬럼 순서의 값 튜플. period_code 가 없으면 None."""
+        period = data.get('period_code')
+        if not period:
+            logger.warning("[FinancialRepo] Missing period_code for %s, skipping save.", ticker)
+            return None
+        return (ticker, period, data.get('report_type', 'Quarterly'), *(data.get(col) for col in _FIN_VALUE_COLS))
+
+    def save_financial_statements_bulk(self, records: List[Tuple[str, Dict[str, Any]]]) -> int:
         """
-        if not data.get('period_code'):
-            logger.warning(f"Missing period_code for {ticker}, skipping save.")
-            return
-
-        query = """
-        INSERT INTO financial_statements (
-            ticker_code, period_code, report_type,
-            total_assets, total_liabilities, total_equity,
-            current_assets, current_liabilities,
-            revenue, operating_income, net_income, gross_profit,
-            operating_cash_flow, total_shares,
-            eps, bps, gross_margin, operating_margin, net_margin,
-            roa, roe, current_ratio, debt_ratio, asset_turnover,
-            updated_at
-        ) VALUES (
-            %(ticker)s, %(period)s, %(report_type)s,
-            %(assets)s, %(libs)s, %(equity)s,
-            %(curr_assets)s, %(curr_libs)s,
-            %(revenue)s, %(op_inc)s, %(net_inc)s, %(gross_profit)s,
-            %(ocf)s, %(shares)s,
-            %(eps)s, %(bps)s, %(gm)s, %(om)s, %(nm)s,
-            %(roa)s, %(roe)s, %(curr_ratio)s, %(debt_ratio)s, %(asset_turnover)s,
-            NOW()
-        )
-        ON CONFLICT (ticker_code, period_code, report_type) 
-        DO UPDATE SET
-            total_assets = EXCLUDED.total_assets,
-            total_liabilities = EXCLUDED.total_liabilities,
-            total_equity = EXCLUDED.total_equity,
-            current_assets = EXCLUDED.current_assets,
-            current_liabilities = EXCLUDED.current_liabilities,
-            revenue = EXCLUDED.revenue,
-            operating_income = EXCLUDED.operating_income,
-            net_income = EXCLUDED.net_income,
-            gross_profit = EXCLUDED.gross_profit,
-            operating_cash_flow = EXCLUDED.operating_cash_flow,
-            total_shares = EXCLUDED.total_shares,
-            eps = EXCLUDED.eps,
-            bps = EXCLUDED.bps,
-            gross_margin = EXCLUDED.gross_margin,
-            operating_margin = EXCLUDED.operating_margin,
-            net_margin = EXCLUDED.net_margin,
-            roa = EXCLUDED.roa,
-            roe = EXCLUDED.roe,
-            current_ratio = EXCLUDED.current_ratio,
-            debt_ratio = EXCLUDED.debt_ratio,
-            asset_turnover = EXCLUDED.asset_turnover,
-            updated_at = NOW();
+        Upsert many financial statement records in one execute_values statement.
+        배치가 실패하면 (한 행의 값 오류로 전체가 롤백되는 경우 등) 행 단위로 다시 저장한다.
+        Args:
+            records: [(ticker, data), ...] — data has the same shape as save_financial_statement
+        Returns: number of rows saved
         """
-        
-        params = {
-            'ticker': ticker,
-            'period': data.get('period_code'),
-            'report_type': data.get('report_type', 'Quarterly'),
-            'assets': data.get('total_assets'),
-            'libs': data.get('total_liabilities'),
-            'equity': data.get('total_equity'),
-            'curr_assets': data.get('current_assets'),
-            'curr_libs': data.get('current_liabilities'),
-            'revenue': data.get('revenue'),
-            'op_inc': data.get('operating_income'),
-            'net_inc': data.get('net_income'),
-            'gross_profit': data.get('gross_profit'),
-            'ocf': data.get('operating_cash_flow'),
-            'shares': data.get('total_shares'),
-            'eps': data.get('eps'),
-            'bps': data.get('bps'),
-            'gm': data.get('gross_margin'),
-            'om': data.get('operating_margin'),
-            'nm': data.get('net_margin'),
-            'roa': data.get('roa'),
-            'roe': data.get('roe'),
-            'curr_ratio': data.get('current_ratio'),
-            'debt_ratio': data.get('debt_ratio'),
-            'asset_turnover': data.get('asset_turnover'),
-        }
-        
+        # ON CONFLICT DO UPDATE 는 한 문장 안에서 같은 키를 두 번 갱신할 수 없으므로 키별 마지막 값만 남긴다
+        rows = {}
+        for ticker, data in records:
+            row = self._fin_row(ticker, data)
+            if row is not None:
+                rows[row[:3]] = row
+        if not rows:
+            return 0
+
         try:
-            self.db.execute(query, params)
+            return self.db.execute_values(
+                _FIN_UPSERT_SQL, list(rows.values()), template=_FIN_UPSERT_TEMPLATE, page_size=500
+            )
         except Exception as e:
-            logger.error(f"[FinancialRepo] Save failed for {ticker}-{data.get('period_code')}: {e}")
+            logger.warning("[FinancialRepo] Bulk save failed for %d rows, retrying row by row: %s", len(rows), e)
+
+        return sum(self._save_row(row) for row in rows.values())
 
-    def get_latest_financials(self, ticker: str, report_type='Quarterly', limit=2) -> List[Dict]:
+    def get_latest_financials(
+        self, ticker: str, report_type='Quarterly', limit=2, fields: Optional[Sequence[str]] = None
+    ) -> List[Dict]:
         """
         Get latest N financial statements for a ticker.
+        Args:
+            fields: 조회할 컬럼만 지정 (_FIN_COLS 중에서, 기본은 전체)
         """
-        query = """
-        SELECT 
-            period_code, total_assets, total_liabilities, total_equity,
-            current_assets, current_liabilities,
-            revenue, operating_income, net_income, gross_profit,
-            operating_cash_flow, total_shares,
-            eps, bps, gross_margin, operating_margin, net_margin,
-            roa, roe, current_ratio, debt_ratio, asset_turnover
+        if fields is None:
+            select_list = _FIN_SELECT_ALL
+        else:
+            unknown = set(fields) - set(_FIN_COLS)
+            if unknown:
+                raise ValueError(f"Unknown financial columns: {sorted(unknown)}")
+            select_list = ", ".join(fields)
+
+        query = f"""
+        SELECT {select_list}
         FROM financial_statements
         WHERE ticker_code = %s AND report_type = %s
         ORDER BY period_code DESC
         LIMIT %s
         """
-        
-        rows = self.db.fetch_all(query, (ticker, report_type, limit))
-        
-        results = []
-        keys = [
-            'period_code', 'total_assets', 'total_liabilities', 'total_equity',
-            'current_assets', 'current_liabilities',
-            'revenue', 'operating_income', 'net_income', 'gross_profit',
-            'operating_cash_flow', 'total_shares',
-            'eps', 'bps', 'gross_margin', 'operating_margin', 'net_margin',
-            'roa', 'roe', 'current_ratio', 'debt_ratio', 'asset_turnover'
-        ]
-        
-        for row in rows:
-            results.append(dict(zip(keys, row)))
-            
-        return results
+
+        return self.db.fetch_all(query, (ticker, report_type, limit), cursor_factory=RealDictCursor)
 
 financial_repo = FinancialRepository()
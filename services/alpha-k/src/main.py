@@ -4,6 +4,7 @@ Alpha-K: Multi-Agent Swing Trading System
 Entry Point. 5-Phase Pipeline을 실행한다.
 """
 import argparse
+import asyncio
 import sys
 import os
 import logging
@@ -25,6 +26,28 @@ logging.basicConfig(
 logger = logging.getLogger("alpha-k")
 
 
+async def run_direct(state: dict) -> dict:
+    """
+    --tickers 직접 분석 모드. Phase 1 → 3 → 4 → 5 → Report 를 순서대로 실행하되,
+    Phase 3 의 종목별 Technical / Fundamental / Flow 분석은 asyncio.gather 로 동시에 돌린다.
+    """
+    from src.supervisor.graph import (
+        deep_dive_async, scoring_node, trade_setup_node, report_node, market_filter_node
+    )
+
+    # Phase 1은 여전히 실행 (시장 상태 정보용)
+    state.update(await asyncio.to_thread(market_filter_node, state))
+
+    # Phase 3: Deep Dive (에이전트 병렬)
+    state.update(await deep_dive_async(state))
+
+    # Phase 4: Scoring → Phase 5: Trade Setup → Report (앞 단계 결과에 의존)
+    for node in (scoring_node, trade_setup_node, report_node):
+        state.update(await asyncio.to_thread(node, state))
+
+    return state
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Alpha-K Multi-Agent Swing Trading System",
@@ -88,36 +111,11 @@ Examples:
         print("   Skipping Phase 1 (Market Filter) & Phase 2 (Sector Screening)\n")
 
         # 직접 Phase 3부터 시작하기 위해 graph 대신 개별 실행
-        from src.supervisor.graph import (
-            deep_dive_node, scoring_node, trade_setup_node, report_node, market_filter_node
-        )
-
-        # Phase 1은 여전히 실행 (시장 상태 정보용)
-        state = dict(initial_state)
-        result = market_filter_node(state)
-        state.update(result)
-
-        # Phase 3: Deep Dive
-        result = deep_dive_node(state)
-        state.update(result)
-
-        # Phase 4: Scoring
-        result = scoring_node(state)
-        state.update(result)
-
-        # Phase 5: Trade Setup
-        result = trade_setup_node(state)
-        state.update(result)
-
-        # Report
-        result = report_node(state)
-        state.update(result)
-
-        final_state = state
+        final_state = asyncio.run(run_direct(dict(initial_state)))
     else:
         # ─── Full Pipeline via LangGraph ───
         try:
-            final_state = graph.invoke(initial_state)
+            final_state = asyncio.run(graph.ainvoke(initial_state))
         except Exception as e:
             logger.error(f"Pipeline execution failed: {e}")
             import traceback
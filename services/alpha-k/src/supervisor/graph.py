@@ -11,7 +11,8 @@ Phase 5: Trade Setup & Execution Plan  → RiskAgent
 """
 from dataclasses import asdict
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Literal
+from typing import Dict, Any, List, Literal, Optional
+import asyncio
 import logging
 
 from langgraph.graph import StateGraph, END
@@ -143,120 +144,135 @@ def screening_node(state: AlphaKState) -> Dict:
 # Phase 3: Deep Dive Analysis (Parallel)
 # ═══════════════════════════════════════════════════════════════════
 
-def deep_dive_node(state: AlphaKState) -> Dict:
+# 동시에 분석할 종목 수 (종목당 3개 에이전트가 다시 병렬) — DB 풀/KIS 호출 한도를 넘지 않게 제한
+DEEP_DIVE_CONCURRENCY = 4
+
+
+def _analyze_technical(ticker: str) -> Optional[Dict]:
+    """3A. Technical (TimescaleDB 자동 조회). 데이터가 없으면 None."""
+    tech = technical_agent.analyze(ticker, df=None)
+
+    if tech.current_price == 0:
+        logger.info(f"[Phase 3] No data for {ticker}, skipping")
+        return None
+
+    logger.info(f"[Tech] {ticker} Score={tech.score:.0f} VCP={'Y' if tech.vcp.detected else 'N'} OB={len(tech.order_blocks)}")
+    return {
+        "score": tech.score,
+        "vcp_detected": tech.vcp.detected,
+        "vcp_pivot": tech.vcp.pivot_point,
+        "vcp_tightness": tech.vcp.tightness,
+        "order_blocks": [
+            {"type": ob.ob_type, "top": ob.top, "bottom": ob.bottom, "date": ob.date}
+            for ob in tech.order_blocks
+        ],
+        "poc": tech.poc,
+        "price_above_poc": tech.price_above_poc,
+        "current_price": tech.current_price,
+        "resistance": tech.resistance,
+        "support": tech.support,
+        "rsi_14": tech.rsi_14,
+        "volume_surge": tech.volume_surge,
+    }
+
+
+def _analyze_fundamental(ticker: str) -> Dict:
+    """3B. Fundamental (DB First → KIS API Fallback)."""
+    # Check DB for financials
+    from ..infrastructure.repositories.financial_repository import financial_repo
+    db_rows = financial_repo.get_latest_financials(ticker)
+
+    if db_rows and len(db_rows) >= 1:
+        financials = _map_db_to_fundamental(db_rows)
+    else:
+        # Fallback to API → KIS 데이터를 FundamentalAgent 포맷으로 변환
+        stock_info = data_provider.get_stock_info(ticker)
+        kis_financials = data_provider.get_financial_statements(ticker)
+        financials = _map_kis_to_fundamental(stock_info, kis_financials)
+
+    # Neo4j 경쟁사 비교 포함
+    fund = fundamental_agent.analyze(ticker, financials, sector_avg_per=0) # 0 = Auto lookup peers
+    logger.info(f"[Fund] {ticker} F-Score={fund.f_score}/9 Verdict={fund.verdict.value} (Rel PER={fund.relative_per:.1f})")
+    return {
+        "f_score": fund.f_score,
+        "verdict": fund.verdict.value,
+        "relative_per": fund.relative_per,
+        "peg_ratio": fund.peg_ratio,
+        "dart_risks": fund.dart_risks,
+        "summary": fund.summary,
+    }
+
+
+def _analyze_flow(ticker: str) -> Dict:
+    """3C. Smart Money (TimescaleDB + Neo4j Group)."""
+    flow = smart_money_agent.analyze(ticker)
+    logger.info(f"[Flow] {ticker} Score={flow.flow_score.value} Accum={flow.accumulation_days}d Foreign={flow.net_foreign_amount:,.0f}M")
+    return {
+        "flow_score": flow.flow_score.value,
+        "program_buying": flow.program_buying_positive,
+        "foreign_inst_dominant": flow.foreign_inst_dominant,
+        "accumulation_days": flow.accumulation_days,
+        "net_foreign_m": flow.net_foreign_amount,
+        "net_inst_m": flow.net_inst_amount,
+    }
+
+
+async def deep_dive_async(state: AlphaKState) -> Dict:
     """
-    각 후보 종목에 대해 3개 에이전트를 실행한다.
+    각 후보 종목에 대해 3개 에이전트를 실행한다 (LangGraph async 노드, graph.ainvoke 로 실행).
     A. Technical Analysis (Order Block, VCP, POC)
     B. Fundamental Analysis (F-Score, PER, DART)
     C. Smart Money Flow (수급)
+    Technical 에서 가격 데이터가 확인된 종목만 B/C 를 돌린다 (결과가 버려질 종목에 KIS 호출을 쓰지 않음).
+    B/C 는 서로 독립적인 I/O(DB/API) 대기라 스레드로 겹쳐 실행하고,
+    동시에 분석하는 종목 수는 DEEP_DIVE_CONCURRENCY 로 제한한다.
     """
     print("\n═══ Phase 3: Deep Dive Analysis ═══")
     candidates = state.get("candidate_tickers", [])
 
+    tech_results = {}
+    fund_results = {}
+    flow_results = {}
+
     if not candidates:
         print("  ⚠️ No candidates to analyze")
         return {
-            "technical_results": {},
-            "fundamental_results": {},
-            "flow_results": {},
+            "technical_results": tech_results,
+            "fundamental_results": fund_results,
+            "flow_results": flow_results,
             "current_phase": "deep_dive",
         }
 
-    tech_results = {}
-    fund_results = {}
-    flow_results = {}
-
-    for ticker in candidates:
-        print(f"\n  📊 Analyzing {ticker}...")
-
-        try:
-            # 3A. Technical (TimescaleDB 자동 조회)
-            tech = technical_agent.analyze(ticker, df=None)
-            
-            if tech.current_price == 0:
-                print(f"    ⚠️ No data for {ticker}, skipping")
-                continue
-
-            tech_results[ticker] = {
-                "score": tech.score,
-                "vcp_detected": tech.vcp.detected,
-                "vcp_pivot": tech.vcp.pivot_point,
-                "vcp_tightness": tech.vcp.tightness,
-                "order_blocks": [
-                    {"type": ob.ob_type, "top": ob.top, "bottom": ob.bottom, "date": ob.date}
-                    for ob in tech.order_blocks
-                ],
-                "poc": tech.poc,
-                "price_above_poc": tech.price_above_poc,
-                "current_price": tech.current_price,
-                "resistance": tech.resistance,
-                "support": tech.support,
-                "rsi_14": tech.rsi_14,
-                "volume_surge": tech.volume_surge,
-            }
-            print(f"    [Tech] Score={tech.score:.0f} VCP={'✅' if tech.vcp.detected else '❌'} OB={len(tech.order_blocks)}")
-
-            # 3B. Fundamental (DB First → KIS API Fallback)
-            # Check DB for financials
-            from ..infrastructure.repositories.financial_repository import financial_repo
-            db_rows = financial_repo.get_latest_financials(ticker)
-            financials = {}
-            
-            if db_rows and len(db_rows) >= 1:
-                financials = _map_db_to_fundamental(db_rows)
-            else:
-                # Fallback to API
-                stock_info = data_provider.get_stock_info(ticker)
-                kis_financials = data_provider.get_financial_statements(ticker)
-                
-                # Check api result validity
-                if kis_financials and isinstance(kis_financials, list):
-                     # Attempt to save to DB for next time (Lazy Load)
-                     try:
-                         from ..collector.financial_collector import FinancialCollector
-                         collector = FinancialCollector()
-                         # Just collecting forces fetching again, but cleaner reuse.
-                         # Check if we can just map and save.
-                         # Since collector logic is complex (mapping keys), calling collect(ticker) is easiest but slower (2 calls).
-                         # We'll just rely on _map_kis_to_fundamental for now for immediate use.
-                         pass
-                     except: pass
-                
-                # KIS 데이터를 FundamentalAgent 포맷으로 변환
-                financials = _map_kis_to_fundamental(stock_info, kis_financials)
-            
-            # Neo4j 경쟁사 비교 포함
-            fund = fundamental_agent.analyze(ticker, financials, sector_avg_per=0) # 0 = Auto lookup peers
-            fund_results[ticker] = {
-                "f_score": fund.f_score,
-                "verdict": fund.verdict.value,
-                "relative_per": fund.relative_per,
-                "peg_ratio": fund.peg_ratio,
-                "dart_risks": fund.dart_risks,
-                "summary": fund.summary,
-            }
-            print(f"    [Fund] F-Score={fund.f_score}/9 Verdict={fund.verdict.value} (Rel PER={fund.relative_per:.1f})")
-
-            # 3C. Smart Money (TimescaleDB + Neo4j Group)
-            flow = smart_money_agent.analyze(ticker)
-            flow_results[ticker] = {
-                "flow_score": flow.flow_score.value,
-                "program_buying": flow.program_buying_positive,
-                "foreign_inst_dominant": flow.foreign_inst_dominant,
-                "accumulation_days": flow.accumulation_days,
-                "net_foreign_m": flow.net_foreign_amount,
-                "net_inst_m": flow.net_inst_amount,
-            }
-            print(f"    [Flow] Score={flow.flow_score.value} Accum={flow.accumulation_days}d Foreign={flow.net_foreign_amount:,.0f}M")
-
-        except Exception as e:
-            logger.error(f"[Phase 3] Error analyzing {ticker}: {e}")
-            continue
-
+    semaphore = asyncio.Semaphore(DEEP_DIVE_CONCURRENCY)
+
+    async def analyze(ticker: str):
+        async with semaphore:
+            logger.info(f"[Phase 3] Analyzing {ticker}...")
+            try:
+                tech = await asyncio.to_thread(_analyze_technical, ticker)
+                # 가격 데이터가 없는 종목은 기존처럼 전체 결과에서 제외
+                if tech is None:
+                    return
+                fund, flow = await asyncio.gather(
+                    asyncio.to_thread(_analyze_fundamental, ticker),
+                    asyncio.to_thread(_analyze_flow, ticker),
+                )
+            except Exception as e:
+                logger.error(f"[Phase 3] Error analyzing {ticker}: {e}")
+                return
+
+        tech_results[ticker] = tech
+        fund_results[ticker] = fund
+        flow_results[ticker] = flow
+
+    await asyncio.gather(*(analyze(ticker) for ticker in candidates))
+
+    # 결과 dict 순서는 후보 순서를 유지
+    order = {ticker: i for i, ticker in enumerate(candidates)}
     return {
-        "technical_results": tech_results,
-        "fundamental_results": fund_results,
-        "flow_results": flow_results,
+        "technical_results": dict(sorted(tech_results.items(), key=lambda kv: order[kv[0]])),
+        "fundamental_results": dict(sorted(fund_results.items(), key=lambda kv: order[kv[0]])),
+        "flow_results": dict(sorted(flow_results.items(), key=lambda kv: order[kv[0]])),
         "current_phase": "deep_dive",
     }
 
@@ -541,7 +557,7 @@ def build_graph() -> StateGraph:
     # Add Nodes
     builder.add_node("market_filter", market_filter_node)
     builder.add_node("screening", screening_node)
-    builder.add_node("deep_dive", deep_dive_node)
+    builder.add_node("deep_dive", deep_dive_async)
     builder.add_node("scoring", scoring_node)
     builder.add_node("trade_setup", trade_setup_node)
     builder.add_node("report", report_node)
@@ -681,5 +697,5 @@ def _map_db_to_fundamental(db_rows: List[Dict]) -> Dict:
 
     return f
 
-# Pre-compiled graph
+# Pre-compiled graph (deep_dive 가 async 노드이므로 graph.ainvoke 로 실행)
 graph = build_graph().compile()
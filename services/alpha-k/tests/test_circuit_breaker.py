@@ -0,0 +1,93 @@
+"""
+CircuitBreaker 테스트
+=====================
+연속 실패 시 open, 쿨다운 후 시험 호출 1건(half-open), 성공 시 초기화와 stats 노출을 확인한다.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.infrastructure import circuit_breaker
+from src.infrastructure.circuit_breaker import CircuitBreaker, breaker_stats
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_opens_after_threshold_consecutive_failures(clock):
+    breaker = CircuitBreaker("test-open")
+
+    for _ in range(CircuitBreaker.FAIL_THRESHOLD - 1):
+        breaker.record_failure()
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert not breaker.allow()
+    assert breaker.stats() == {"open": 1, "fails": 0, "trips": 1}
+
+
+def test_allows_a_trial_call_after_cooldown(clock):
+    breaker = CircuitBreaker("test-cooldown")
+    for _ in range(CircuitBreaker.FAIL_THRESHOLD):
+        breaker.record_failure()
+
+    clock[0] += CircuitBreaker.COOLDOWN_SEC - 1
+    assert not breaker.allow()
+    clock[0] += 1
+    assert breaker.allow()
+    assert not breaker.allow()  # 시험 호출은 하나만
+
+    breaker.record_success()
+    assert breaker.allow()
+    assert breaker.stats() == {"open": 0, "fails": 0, "trips": 1}
+
+
+def test_failed_trial_call_reopens_immediately(clock):
+    breaker = CircuitBreaker("test-half-open-fail")
+    for _ in range(CircuitBreaker.FAIL_THRESHOLD):
+        breaker.record_failure()
+
+    clock[0] += CircuitBreaker.COOLDOWN_SEC
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert not breaker.allow()
+    assert breaker.stats() == {"open": 1, "fails": 0, "trips": 2}
+    clock[0] += CircuitBreaker.COOLDOWN_SEC
+    assert breaker.allow()
+
+
+def test_unreported_trial_is_retried_after_another_cooldown(clock):
+    breaker = CircuitBreaker("test-half-open-lost")
+    for _ in range(CircuitBreaker.FAIL_THRESHOLD):
+        breaker.record_failure()
+
+    clock[0] += CircuitBreaker.COOLDOWN_SEC
+    assert breaker.allow()
+    assert not breaker.allow()
+    clock[0] += CircuitBreaker.COOLDOWN_SEC
+    assert breaker.allow()
+
+
+def test_success_resets_the_failure_streak(clock):
+    breaker = CircuitBreaker("test-reset")
+    for _ in range(CircuitBreaker.FAIL_THRESHOLD - 1):
+        breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.allow()
+    assert breaker.stats()["fails"] == 1
+
+
+def test_breaker_stats_lists_every_breaker_by_name(clock):
+    CircuitBreaker("test-registry")
+
+    assert breaker_stats()["test-registry"] == {"open": 0, "fails": 0, "trips": 0}
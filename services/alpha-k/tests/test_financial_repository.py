@@ -0,0 +1,80 @@
+"""
+재무제표 bulk upsert 테스트
+===========================
+save_financial_statements_bulk 의 키별 중복 제거, period_code 누락 행 제외,
+배치 실패 시 행 단위 재시도와 반환 건수를 확인한다.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.infrastructure.repositories.financial_repository import _FIN_VALUE_COLS, FinancialRepository
+
+REVENUE = 3 + _FIN_VALUE_COLS.index("revenue")  # (ticker, period, report_type, 값...) 튜플 위치
+
+
+class FakeDB:
+    """execute_values 호출을 기록한다. bad_periods 가 들어 있는 문장은 실패시킨다."""
+
+    def __init__(self, bad_periods=()):
+        self.bad_periods = set(bad_periods)
+        self.calls = []
+
+    def execute_values(self, query, values, template=None, page_size=500):
+        self.calls.append(list(values))
+        if any(row[1] in self.bad_periods for row in values):
+            raise ValueError("numeric field overflow")
+        return len(values)
+
+
+def _record(period, revenue, report_type="Quarterly"):
+    return {"period_code": period, "report_type": report_type, "revenue": revenue}
+
+
+def test_duplicate_keys_keep_the_last_value_in_one_statement():
+    db = FakeDB()
+    repo = FinancialRepository(db=db)
+
+    saved = repo.save_financial_statements_bulk([
+        ("005930", _record("2023.12", 1)),
+        ("005930", _record("2023.12", 2)),
+        ("005930", _record("2023.12", 3, report_type="Annual")),
+        ("005930", {"revenue": 4}),  # period_code 없음 → 제외
+    ])
+
+    assert saved == 2
+    assert len(db.calls) == 1
+    rows = {(r[1], r[2]): r for r in db.calls[0]}
+    assert rows[("2023.12", "Quarterly")][REVENUE] == 2
+    assert rows[("2023.12", "Annual")][REVENUE] == 3
+
+
+def test_failed_batch_is_retried_row_by_row():
+    db = FakeDB(bad_periods={"2023.09"})
+    repo = FinancialRepository(db=db)
+
+    saved = repo.save_financial_statements_bulk([
+        ("005930", _record("2023.06", 1)),
+        ("005930", _record("2023.09", 2)),
+        ("005930", _record("2023.12", 3)),
+    ])
+
+    assert saved == 2
+    assert [len(values) for values in db.calls] == [3, 1, 1, 1]
+
+
+def test_nothing_to_save_skips_the_database():
+    db = FakeDB()
+    repo = FinancialRepository(db=db)
+
+    assert repo.save_financial_statements_bulk([("005930", {"revenue": 1})]) == 0
+    assert db.calls == []
+
+
+def test_single_statement_reports_success():
+    repo = FinancialRepository(db=FakeDB(bad_periods={"2023.09"}))
+
+    assert repo.save_financial_statement("005930", _record("2023.12", 1)) is True
+    assert repo.save_financial_statement("005930", _record("2023.09", 1)) is False
+    assert repo.save_financial_statement("005930", {"revenue": 1}) is False
@@ -0,0 +1,59 @@
+"""
+GraphService TTL 캐시 테스트
+============================
+_ttl_cached 조회가 캐시를 공유하지 않는 사본을 돌려주는지, 빈 결과는 캐시하지 않는지,
+invalidate() 후 다시 조회하는지 확인한다.
+"""
+import importlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 패키지 __init__ 이 같은 이름의 인스턴스를 내보내므로 모듈은 import_module 로 가져온다
+graph_service_module = importlib.import_module("src.infrastructure.graph.graph_service")
+
+
+class FakeClient:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def run_query(self, query, parameters=None, read=True):
+        self.calls += 1
+        return [dict(row) for row in self.result]
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(graph_service_module, "_GRAPH_CACHE", graph_service_module.TTLCache(16, 60))
+    svc = graph_service_module.GraphService()
+    svc.client = FakeClient([{"theme": "HBM", "cnt": 3}])
+    return svc
+
+
+def test_cached_result_is_a_copy(service):
+    first = service.get_all_themes()
+    first.append({"theme": "injected"})
+    second = service.get_all_themes()
+
+    assert service.client.calls == 1
+    assert second == [{"theme": "HBM", "cnt": 3}]
+
+
+def test_empty_result_is_not_cached(service):
+    service.client.result = []
+    service.get_all_themes()
+    service.get_all_themes()
+
+    assert service.client.calls == 2
+
+
+def test_invalidate_forces_a_fresh_lookup(service):
+    service.get_all_themes()
+    service.invalidate()
+    service.get_all_themes()
+
+    assert service.client.calls == 2
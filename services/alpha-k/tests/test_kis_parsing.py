@@ -0,0 +1,80 @@
+"""
+KIS 응답 파싱 테스트
+====================
+_parse_dated_rows 의 누락 필드/변환 불가 값 처리와 반환 dtype 을 확인한다.
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.infrastructure.data_providers.kis_client import (
+    _DAILY_PRICE_DTYPES,
+    _DAILY_PRICE_FIELDS,
+    _INVESTOR_DTYPES,
+    _INVESTOR_FIELDS,
+    _parse_dated_rows,
+)
+
+DAILY_FIELDS = {field: col for col, field in _DAILY_PRICE_FIELDS.items()}
+
+
+def _daily_row(date, close, **extra):
+    row = {
+        "stck_bsop_date": date,
+        "stck_oprc": "100", "stck_hgpr": "110", "stck_lwpr": "90",
+        "stck_clpr": close, "acml_vol": "1000", "prdy_ctrt": "1.5",
+    }
+    row.update(extra)
+    return row
+
+
+def test_rows_are_sorted_ascending_with_64bit_dtypes():
+    rows = [_daily_row("20240103", "105"), _daily_row("20240102", "100")]
+
+    df = _parse_dated_rows(rows, DAILY_FIELDS, _DAILY_PRICE_DTYPES)
+
+    assert list(df.index.strftime("%Y%m%d")) == ["20240102", "20240103"]
+    assert list(df["Close"]) == [100, 105]
+    assert df["Close"].dtype == np.int64
+    assert df["Change"].dtype == np.float64
+
+
+def test_field_missing_from_some_rows_defaults_to_zero():
+    rows = [
+        _daily_row("20240102", "100"),
+        {k: v for k, v in _daily_row("20240103", "105").items() if k != "prdy_ctrt"},
+    ]
+
+    df = _parse_dated_rows(rows, DAILY_FIELDS, _DAILY_PRICE_DTYPES)
+
+    assert len(df) == 2
+    assert list(df["Change"]) == [1.5, 0.0]
+
+
+def test_field_missing_from_every_row_defaults_to_zero():
+    rows = [{"stck_bsop_date": "20240102", "frgn_ntby_qty": "10"}]
+
+    df = _parse_dated_rows(rows, _INVESTOR_FIELDS, _INVESTOR_DTYPES)
+
+    assert df.loc["2024-01-02", "foreigner_net_qty"] == 10
+    assert df.loc["2024-01-02", "individual_net_amt"] == 0
+
+
+def test_unparsable_value_or_date_drops_only_that_row():
+    rows = [
+        _daily_row("20240102", "100"),
+        _daily_row("20240103", ""),
+        _daily_row("2024-13-45", "103"),
+        _daily_row("20240105", "104"),
+    ]
+
+    df = _parse_dated_rows(rows, DAILY_FIELDS, _DAILY_PRICE_DTYPES)
+
+    assert list(df.index.strftime("%Y%m%d")) == ["20240102", "20240105"]
+
+
+def test_empty_response_returns_empty_frame():
+    assert _parse_dated_rows([], DAILY_FIELDS, _DAILY_PRICE_DTYPES).empty
@@ -0,0 +1,126 @@
+"""
+OHLCV 캐시 테스트
+=================
+가짜 DB 로 MarketDataProvider 의 LRU 적중/사본 반환, NOTIFY 세대 증가와
+ticker_versions 버전 변경에 의한 무효화, batch 조회의 종목별 사본을 확인한다.
+"""
+import os
+import sys
+import warnings
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.infrastructure.data_providers import market_data
+from src.infrastructure.data_providers.market_data import MarketDataProvider
+from src.infrastructure.db.instrumentation import InstrumentedCache
+
+
+class FakeDB:
+    """fetch_prepared(ohlcv) / fetch_all(ticker_versions, batch) 호출을 세는 가짜 DB."""
+
+    is_available = False  # 리스너를 띄우지 않는다
+
+    def __init__(self):
+        self.versions = {}
+        self.ohlcv_queries = []
+        self.version_lock_held = []
+        self.batch_rows = []
+
+    def fetch_prepared(self, name, query, params):
+        ticker = params[0]
+        self.ohlcv_queries.append(ticker)
+        return [
+            (datetime(2024, 1, day), 100.0 + day, 110.0, 90.0, 105.0, 1000, 105000, 1.5)
+            for day in range(2, 9)
+        ]
+
+    def fetch_all(self, query, params=None, cursor_factory=None):
+        if "ticker_versions" in query:
+            self.version_lock_held.append(market_data._versions_lock.locked())
+            return list(self.versions.items())
+        return list(self.batch_rows)
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    monkeypatch.setattr(market_data, "_OHLCV_CACHE", InstrumentedCache(4))
+    monkeypatch.setattr(market_data, "_ohlcv_generations", {})
+    monkeypatch.setattr(market_data, "_ticker_versions", {})
+    monkeypatch.setattr(market_data, "_versions_loaded_at", 0.0)
+    p = MarketDataProvider(kis_client=object())
+    p.db = FakeDB()
+    return p
+
+
+def _get(provider, ticker="005930"):
+    return provider._get_ohlcv_from_db(ticker, "2024-01-01", "2024-01-31")
+
+
+def test_repeated_window_is_served_from_cache_as_independent_copies(provider):
+    first = _get(provider)
+    first.loc[first.index[0], "Close"] = -1.0
+    second = _get(provider)
+
+    assert provider.db.ohlcv_queries == ["005930"]
+    assert second["Close"].iloc[0] == 105.0
+    assert second["Close"].dtype == np.float64
+    assert market_data._OHLCV_CACHE.hits == 1
+    assert market_data._OHLCV_CACHE.misses == 1
+
+
+def test_notify_bumps_only_that_tickers_generation(provider):
+    _get(provider, "005930")
+    _get(provider, "000660")
+
+    market_data._invalidate_ohlcv("005930,2024-01-05")
+    _get(provider, "005930")
+    _get(provider, "000660")
+
+    assert provider.db.ohlcv_queries == ["005930", "000660", "005930"]
+
+
+def test_version_change_invalidates_after_refresh(provider, monkeypatch):
+    _get(provider)
+
+    provider.db.versions = {"005930": 2}
+    monkeypatch.setattr(market_data, "_versions_loaded_at", 0.0)
+    _get(provider)
+    _get(provider)
+
+    assert provider.db.ohlcv_queries == ["005930", "005930"]
+
+
+def test_version_refresh_runs_outside_the_lock(provider):
+    _get(provider)
+
+    assert provider.db.version_lock_held == [False]
+
+
+def test_lru_evicts_oldest_window(provider):
+    for ticker in ("A", "B", "C", "D", "E"):
+        _get(provider, ticker)
+    _get(provider, "A")
+
+    assert market_data._OHLCV_CACHE.evictions >= 1
+    assert provider.db.ohlcv_queries == ["A", "B", "C", "D", "E", "A"]
+
+
+def test_batch_query_returns_independent_per_ticker_frames(provider):
+    provider.db.batch_rows = [
+        (datetime(2024, 1, 2), "A", 1.0, 1.0, 1.0, 1.0, 10, 10),
+        (datetime(2024, 1, 3), "A", 2.0, 2.0, 2.0, 2.0, 20, 40),
+        (datetime(2024, 1, 2), "B", 3.0, 3.0, 3.0, 3.0, 30, 90),
+    ]
+
+    result = provider._get_ohlcv_batch_from_db(["A", "B"], "2024-01-01", "2024-01-31")
+
+    assert sorted(result) == ["A", "B"]
+    assert len(result["A"]) == 2 and len(result["B"]) == 1
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result["A"]["Close"] = 0.0
+    assert result["B"]["Close"].iloc[0] == 3.0
@@ -0,0 +1,88 @@
+"""
+/stats · /metrics 테스트
+========================
+api_main 의 /stats 가 돌려주는 {db_client.stats(), breakers} 구조와
+/metrics 의 Prometheus 텍스트 변환(prometheus_lines)을 확인한다.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.infrastructure.circuit_breaker import CircuitBreaker, breaker_stats
+from src.infrastructure.db.db_client import db_client
+from src.infrastructure.db.instrumentation import (
+    InstrumentedCache,
+    LatencyHistogram,
+    prometheus_lines,
+    timed,
+)
+
+
+def _endpoint_stats():
+    """api_main.stats() 와 같은 조합."""
+    return {**db_client.stats(), "breakers": breaker_stats()}
+
+
+def test_instrumented_cache_counts_hits_misses_and_evictions():
+    cache = InstrumentedCache(2)
+    for key in ("a", "b", "c"):
+        cache[key] = key
+    cache.hits, cache.misses = 3, 1
+
+    assert cache.stats() == {
+        "size": 2, "maxsize": 2, "hits": 3, "misses": 1, "evictions": 1, "hit_ratio": 0.75,
+    }
+
+
+def test_latency_histogram_buckets_are_cumulative():
+    hist = LatencyHistogram()
+    for ms in (0.5, 3, 3, 2000):
+        hist.observe(int(ms * 1_000_000))
+
+    buckets = hist.stats()["buckets_ms"]
+    assert buckets["1"] == 1
+    assert buckets["5"] == 3
+    assert buckets["1000"] == 3
+    assert buckets["5000"] == 4
+    assert buckets["+Inf"] == 4
+
+
+def test_stats_payload_includes_registered_caches_latency_and_breakers():
+    db_client.register_cache("test_cache", InstrumentedCache(8))
+    timed("test_query")(lambda: None)()
+    CircuitBreaker("test-backend")
+
+    stats = _endpoint_stats()
+
+    assert set(stats) == {"pool", "caches", "latency", "breakers"}
+    assert stats["caches"]["test_cache"]["maxsize"] == 8
+    assert stats["latency"]["test_query"]["count"] == 1
+    assert stats["breakers"]["test-backend"]["open"] == 0
+
+
+def test_metrics_text_exposition():
+    stats = {
+        "pool": {"in_use": 2},
+        "caches": {"ohlcv": {"hits": 5}},
+        "latency": {"ohlcv_db": {"count": 1, "buckets_ms": {"1": 0, "+Inf": 1}}},
+        "breakers": {"neo4j": {"open": 1}},
+    }
+
+    lines = prometheus_lines(stats).splitlines()
+
+    assert lines == [
+        "alpha_k_db_pool_in_use 2",
+        'alpha_k_cache_hits{cache="ohlcv"} 5',
+        'alpha_k_query_duration_ms_bucket{query="ohlcv_db",le="1"} 0',
+        'alpha_k_query_duration_ms_bucket{query="ohlcv_db",le="+Inf"} 1',
+        'alpha_k_query_duration_ms_count{query="ohlcv_db"} 1',
+        'alpha_k_breaker_open{backend="neo4j"} 1',
+    ]
+
+
+def test_metrics_renders_the_live_stats_payload():
+    text = prometheus_lines(_endpoint_stats())
+
+    assert text.endswith("\n")
+    assert all(" " in line for line in text.splitlines())
@@ -0,0 +1,120 @@
+"""
+Migrator 동작 테스트
+====================
+실제 DB 없이 schema_migrations/테이블 존재 여부만 흉내 내는 가짜 커서로
+run_migrations 의 적용/기록/재실행 동작을 확인한다.
+"""
+import os
+import sys
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.infrastructure.db import migrator
+
+MIGRATION_FILES = sorted(
+    f for f in os.listdir(os.path.join(os.path.dirname(migrator.__file__), "migrations"))
+    if f.endswith(".sql")
+)
+
+
+class FakeDB:
+    """schema_migrations 와 테이블 목록만 가진 가짜 DB. 파일 SQL 실행 내역을 기록한다."""
+
+    def __init__(self, tables=(), compressed=False):
+        self.tables = set(tables)
+        self.migrations = None  # schema_migrations 테이블 (None = 없음)
+        self.compressed = compressed
+        self.executed_files = []
+
+    @contextmanager
+    def get_cursor(self, cursor_factory=None):
+        yield FakeCursor(self)
+
+
+class FakeCursor:
+    def __init__(self, db: FakeDB):
+        self.db = db
+        self._result = []
+
+    def execute(self, sql, params=None):
+        stripped = sql.strip()
+        self._result = []
+        if stripped.startswith(("SET LOCAL", "SAVEPOINT", "RELEASE", "ROLLBACK TO")):
+            return
+        if "pg_advisory_xact_lock" in stripped:
+            return
+        if "CREATE TABLE IF NOT EXISTS schema_migrations" in stripped:
+            if self.db.migrations is None:
+                self.db.migrations = set()
+            return
+        if stripped.startswith("SELECT filename FROM schema_migrations"):
+            self._result = [(name,) for name in sorted(self.db.migrations)]
+            return
+        if "to_regclass" in stripped:
+            self._result = [(params[0] in self.db.tables,)]
+            return
+        if stripped.startswith("INSERT INTO schema_migrations"):
+            self.db.migrations.add(params[0])
+            return
+
+        # 마이그레이션 파일 본문
+        header = stripped.splitlines()[0].lstrip("- ").strip()
+        if header == "001_init.sql" and self.db.compressed:
+            raise RuntimeError("cannot change configuration on already compressed chunks")
+        self.db.executed_files.append(header)
+        if header == "001_init.sql":
+            self.db.tables.update({"ohlcv_daily", "tickers", "ohlcv_minute", "sector_indices"})
+        elif header == "002_investor_trading.sql":
+            self.db.tables.add("investor_trading")
+        elif header == "003_financials.sql":
+            self.db.tables.add("financial_statements")
+
+    def fetchone(self):
+        return self._result[0] if self._result else None
+
+    def fetchall(self):
+        return list(self._result)
+
+
+def test_fresh_database_applies_every_file(monkeypatch):
+    db = FakeDB()
+    monkeypatch.setattr(migrator, "db_client", db)
+
+    migrator.run_migrations()
+
+    assert db.executed_files == MIGRATION_FILES
+    assert db.migrations == set(MIGRATION_FILES)
+
+
+def test_existing_database_records_baseline_and_reruns_nothing(monkeypatch):
+    # 마이그레이터 도입 이전 DB: baseline 테이블은 있고, ohlcv_daily 청크는 이미 압축됨
+    db = FakeDB(
+        tables={"ohlcv_daily", "investor_trading", "financial_statements"},
+        compressed=True,
+    )
+    monkeypatch.setattr(migrator, "db_client", db)
+
+    migrator.run_migrations()
+
+    baseline = set(migrator.BASELINE_MIGRATIONS)
+    assert not baseline & set(db.executed_files)
+    assert db.executed_files == [f for f in MIGRATION_FILES if f not in baseline]
+    assert db.migrations == set(MIGRATION_FILES)
+
+    # 두 번째 기동: 아무 파일도 다시 실행하지 않는다
+    db.executed_files.clear()
+    migrator.run_migrations()
+
+    assert db.executed_files == []
+    assert db.migrations == set(MIGRATION_FILES)
+
+
+def test_failed_file_is_not_recorded_and_retried(monkeypatch):
+    db = FakeDB(compressed=True)  # 001 실행이 실패하도록
+    monkeypatch.setattr(migrator, "db_client", db)
+
+    migrator.run_migrations()
+
+    assert "001_init.sql" not in db.migrations
+    assert "004_ohlcv_notify.sql" in db.migrations
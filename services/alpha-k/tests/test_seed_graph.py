@@ -0,0 +1,98 @@
+"""
+그래프 시드 쓰기 경로 테스트
+============================
+가짜 graph_client 로 시더가 UNWIND 배치를 한 트랜잭션(execute_write_many)에 묶어 보내는지,
+쓰기 실패를 삼키지 않는지, seed_all 이 조회 캐시를 비우는지 확인한다.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.infrastructure.graph import seed_graph
+
+
+class FakeGraphClient:
+    is_connected = True
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.transactions = []
+
+    def execute_write_many(self, queries, database="neo4j", raise_errors=False):
+        assert raise_errors, "시드 쓰기는 실패를 호출자에게 전달해야 한다"
+        if self.fail:
+            raise RuntimeError("deadlock detected")
+        self.transactions.append(list(queries))
+        return [[] for _ in queries]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeGraphClient()
+    monkeypatch.setattr(seed_graph, "graph_client", fake)
+    return fake
+
+
+def test_seed_nodes_writes_tickers_then_companies_in_one_transaction(client):
+    seed_graph.seed_nodes()
+
+    assert len(client.transactions) == 1
+    (ticker_q, ticker_p), (company_q, company_p) = client.transactions[0]
+    assert ticker_q == f"UNWIND $rows AS r {seed_graph._Q_MERGE_TICKER_ROW}"
+    assert company_q == f"UNWIND $rows AS r {seed_graph._Q_MERGE_COMPANY_ROW}"
+
+    ticker_codes = [row["code"] for row in ticker_p["rows"]]
+    company_codes = [row["code"] for row in company_p["rows"]]
+    assert len(ticker_codes) == len(set(ticker_codes)) == len(seed_graph._tickers_master())
+    assert len(company_codes) == len(set(company_codes))
+
+
+def test_seed_ownership_links_each_known_ticker_once(client):
+    seed_graph.seed_ownership()
+
+    (_, rel_p), (link_q, link_p) = client.transactions[0]
+    assert len(rel_p["rows"]) == len(seed_graph._OWNERSHIP)
+    assert link_q.endswith(seed_graph._Q_IS_TICKER_ROW)
+    codes = [row["code"] for row in link_p["rows"]]
+    assert len(codes) == len(set(codes))
+    assert set(codes) <= set(seed_graph._tickers_master())
+
+
+def test_seed_competitors_removes_reverse_duplicates_before_merging(client):
+    seed_graph.seed_competitors()
+
+    (dedupe_q, _), = client.transactions[0]
+    (merge_q, merge_p), = client.transactions[1]
+    assert dedupe_q == seed_graph._Q_DEDUPE_COMPETITORS
+    assert merge_q.endswith(seed_graph._Q_COMPETITORS_ROW)
+    assert len(merge_p["rows"]) == len(seed_graph._COMPETITORS)
+
+
+def test_empty_steps_are_not_sent(client):
+    seed_graph._write_steps([(seed_graph._Q_MERGE_TICKER_ROW, [])])
+
+    assert client.transactions == []
+
+
+def test_write_failure_propagates(monkeypatch):
+    monkeypatch.setattr(seed_graph, "graph_client", FakeGraphClient(fail=True))
+
+    with pytest.raises(RuntimeError):
+        seed_graph.seed_competitors()
+
+
+def test_seed_all_invalidates_graph_cache_even_on_failure(client, monkeypatch):
+    invalidated = []
+    monkeypatch.setattr(seed_graph.graph_service, "invalidate", lambda: invalidated.append(True))
+
+    async def failing_seed():
+        raise RuntimeError("deadlock detected")
+
+    monkeypatch.setattr(seed_graph, "_seed_data_async", failing_seed)
+
+    with pytest.raises(RuntimeError):
+        seed_graph.seed_all()
+    assert invalidated == [True]